@@ -425,8 +425,8 @@ class AIDriver(AssistanceSystem):
 
 
         # --- All checks passed – start traffic ---
-        self.event_bus.emit("send_command_to_lfs", "/axload AI_Traffic")
-        self.event_bus.emit("send_command_to_lfs", "/restart")
+        self.event_bus.emit("send_command_to_lfs", b"/axload AI_Traffic")
+        self.event_bus.emit("send_command_to_lfs", b"/restart")
 
         self._load_routes()
         self.assigned_routes = {}
@@ -5,7 +5,7 @@ from typing import Dict, Any
 from assistance.base_system import AssistanceSystem
 from core.event_bus import EventBus
 from core.settings_manager import SettingsManager
-from misc.helpers import calc_polygon_points
+from misc.helpers import calc_polygon_points, calc_polygon_points_batch
 from vehicles.own_vehicle import OwnVehicle
 from vehicles.vehicle import Vehicle
 from shapely import Polygon
@@ -40,11 +40,11 @@ def _create_rectangles_for_blindspot_warning(cars):
         factor = 2.3 * 65536
         heading_offset = 16384
         heading_divisor = 182.05
-        angle_offsets = [22, 158, 202, 338]
+        angle_offsets = (22, 158, 202, 338)
         for car in cars.values():
             x, y, heading = car.data.x, car.data.y, car.data.heading
             angle_of_car = abs((heading - heading_offset) / heading_divisor)
-            polygon_points = [calc_polygon_points(x, y, factor, angle_of_car + offset) for offset in angle_offsets]
+            polygon_points = calc_polygon_points_batch(x, y, factor, [angle_of_car + offset for offset in angle_offsets])
             rectangles.append((car.data.speed, car.data.distance_to_player, Polygon(polygon_points), heading))
 
         return rectangles
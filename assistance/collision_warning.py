@@ -3,7 +3,7 @@ from assistance import park_distance_control
 from assistance.base_system import AssistanceSystem
 from core.event_bus import EventBus
 from core.settings_manager import SettingsManager
-from misc.helpers import calc_polygon_points, point_in_rectangle
+from misc.helpers import calc_polygon_points, points_in_rectangle
 from vehicles.own_vehicle import OwnVehicle
 from vehicles.vehicle import Vehicle
 
@@ -44,8 +44,10 @@ class ForwardCollisionWarning(AssistanceSystem):
         factors = [7.5, 3.0, 2.0] if cw_dist == 0 else [7.5, 5.0, 2.5] if cw_dist == 1 else [7.5, 6.5, 5.5]
 
 
-        for vehicle in vehicles.values():
-            if self._is_vehicle_ahead(vehicle):
+        others = list(vehicles.values())
+        ahead = points_in_rectangle([(v.data.x, v.data.y) for v in others], self.own_rectangle)
+        for vehicle, is_ahead in zip(others, ahead):
+            if is_ahead:
                 needed_braking = self._calculate_needed_braking(own_vehicle, vehicle)  # Nötiges Bremsen in m/s^2
                 max_needed_deceleration = max(max_needed_deceleration, needed_braking)
                 if needed_braking != float('inf'):
@@ -78,13 +80,6 @@ class ForwardCollisionWarning(AssistanceSystem):
             'level': warning_level,
         }
 
-    def _is_vehicle_ahead(self, other_vehicle: Vehicle) -> bool:
-        """Prüft ob Fahrzeug vor uns ist"""
-
-        is_vehicle_ahead = point_in_rectangle(other_vehicle.data.x, other_vehicle.data.y, self.own_rectangle)
-
-        return is_vehicle_ahead
-
     def _calculate_needed_braking(self, own_vehicle: OwnVehicle, other_vehicle: Vehicle) -> float:
         """
         Calculates the EXACT needed acceleration (negative for braking)
@@ -1,125 +1,187 @@
+import json
 import math
 import os
 import time
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 import pyinsim.func
 from assistance.base_system import AssistanceSystem
 from core.event_bus import EventBus
 from core.settings_manager import SettingsManager
-from misc.helpers import calc_polygon_points
+from misc.helpers import trig_u16, append_json_lines, iter_json_lines
 from misc.spacial_hash_grid import SpatialHashGrid
 from vehicles.own_vehicle import OwnVehicle
 from vehicles.vehicle import Vehicle
 
+_CAR_SIZES = {
+    b'UF1': (2.95, 1.5),
+    b'XFG': (3.7, 1.7),
+    b'XRG': (4.5, 1.8),
+    b'LX4': (3.6, 1.7),
+    b'LX6': (3.6, 1.7),
+    b'RB4': (4.5, 1.9),
+    b'FXO': (4.5, 1.9),
+    b'XRT': (4.5, 1.9),
+    b'RAC': (4.1, 1.8),
+    b'FZ5': (4.6, 2),
+    b'UFR': (3.2, 1.6),
+    b'XFR': (3.9, 1.9),
+    b'FXR': (5.0, 2.1),
+    b'XRR': (5.0, 2.1),
+    b'FZR': (5.0, 2.1),
+}
+
+_OBJECT_SIZES = {
+    40: (0.7, 0.4),
+    52: (0.75, 0.75),
+    53: (0.75, 0.75),
+    54: (0.75, 0.75),
+    55: (0.75, 0.75),
+    64: (0.3, 1.4),
+    65: (0.3, 1.4),
+    66: (0.3, 1.4),
+    67: (0.3, 1.4),
+    68: (0.3, 1.4),
+    69: (0.3, 1.4),
+    70: (0.3, 1.4),
+    71: (0.3, 1.4),
+    72: (0.3, 1.4),
+    73: (0.3, 1.4),
+    74: (0.3, 1.4),
+    75: (0.3, 1.4),
+    76: (0.3, 1.4),
+    77: (0.3, 1.4),
+    78: (0.3, 1.4),
+    79: (0.3, 1.4),
+    80: (0.3, 1.4),
+    81: (0.3, 1.4),
+    82: (0.3, 1.4),
+    83: (0.3, 1.4),
+    84: (0.3, 1.4),
+    85: (0.3, 1.4),
+    86: (0.3, 1.4),
+    87: (0.3, 1.4),
+    88: (0.3, 1.4),
+    89: (0.3, 1.4),
+    90: (0.3, 1.4),
+    91: (0.3, 1.4),
+    92: (0.3, 0.8),
+    93: (0.3, 1.0),
+    96: (3.8, 0.3),
+    97: (10.1, 0.3),
+    98: (16.6, 0.3),
+    104: (8.3, 0.3),
+    105: (1.3, 0.3),
+    106: (1.3, 0.3),
+    112: (1.0, 6.0),
+    124: (4.1, 1.95),
+    125: (5.4, 2),
+    126: (5.4, 2),
+    127: (6.7, 2.3),
+    136: (0.2, 0.2),
+    137: (0.2, 0.2),
+    138: (0.2, 0.2),
+    139: (0.2, 0.2),
+    140: (5.8, 5.8),
+    144: (0.75, 1.75),
+    145: (1.3, 1.3),
+    146: (0.65, 0.65),
+    147: (0.2, 2.5),
+    148: (0.2, 2.5),
+    160: (0.7, 0.7),
+    161: (0.7, 0.7),
+    164: (0.3, 4.8),
+    165: (0.3, 4.8),
+    168: (1.3, 1.3),
+    169: (1.3, 1.3),
+    # Weitere Indizes und Größen können hier hinzugefügt werden
+}
+
+# Direkte Lookup-Tabelle über alle 256 möglichen Objekt-Indizes (Standardgröße 0.5 x 0.5)
+_OBJECT_SIZE_LUT = tuple(_OBJECT_SIZES.get(index, (0.5, 0.5)) for index in range(256))
+
+# Objects without hitbox
+_NO_HITBOX_OBJECTS = frozenset([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 16, 17, 128, 129, 130, 131, 132, 149, 150,
+                                151, 172, 173, 174, 175, 176, 177, 178, 179, 184, 185, 186, 252, 253, 254, 255])
+
+
+# PDC-Ergebnis pro Sensor (0-2 vorne, 3-5 hinten): -1 = inaktiv, 0 = frei, 1-3 = Abstandsstufe
+_PDC_INACTIVE = (-1,) * 6
+_PDC_READY = (0,) * 6
+
+
 def get_vehicle_size(cname) -> tuple:
-    car_sizes = {
-        b'UF1': (2.95, 1.5),
-        b'XFG': (3.7, 1.7),
-        b'XRG': (4.5, 1.8),
-        b'LX4': (3.6, 1.7),
-        b'LX6': (3.6, 1.7),
-        b'RB4': (4.5, 1.9),
-        b'FXO': (4.5, 1.9),
-        b'XRT': (4.5, 1.9),
-        b'RAC': (4.1, 1.8),
-        b'FZ5': (4.6, 2),
-        b'UFR': (3.2, 1.6),
-        b'XFR': (3.9, 1.9),
-        b'FXR': (5.0, 2.1),
-        b'XRR': (5.0, 2.1),
-        b'FZR': (5.0, 2.1),
-    }
-    return car_sizes.get(cname, (4.5, 1.8))  # Standardgröße falls Index nicht gefunden wird
+    return _CAR_SIZES.get(cname, (4.5, 1.8))  # Standardgröße falls Index nicht gefunden wird
+
+
 def get_object_size(index: int) -> tuple:
     """Gibt die Größe des Objekts basierend auf dem Index zurück"""
-    object_sizes = {
-        40: (0.7, 0.4),
-        52: (0.75, 0.75),
-        53: (0.75, 0.75),
-        54: (0.75, 0.75),
-        55: (0.75, 0.75),
-        64: (0.3, 1.4),
-        65: (0.3, 1.4),
-        66: (0.3, 1.4),
-        67: (0.3, 1.4),
-        68: (0.3, 1.4),
-        69: (0.3, 1.4),
-        70: (0.3, 1.4),
-        71: (0.3, 1.4),
-        72: (0.3, 1.4),
-        73: (0.3, 1.4),
-        74: (0.3, 1.4),
-        75: (0.3, 1.4),
-        76: (0.3, 1.4),
-        77: (0.3, 1.4),
-        78: (0.3, 1.4),
-        79: (0.3, 1.4),
-        80: (0.3, 1.4),
-        81: (0.3, 1.4),
-        82: (0.3, 1.4),
-        83: (0.3, 1.4),
-        84: (0.3, 1.4),
-        85: (0.3, 1.4),
-        86: (0.3, 1.4),
-        87: (0.3, 1.4),
-        88: (0.3, 1.4),
-        89: (0.3, 1.4),
-        90: (0.3, 1.4),
-        91: (0.3, 1.4),
-        92: (0.3, 0.8),
-        93: (0.3, 1.0),
-        96: (3.8, 0.3),
-        97: (10.1, 0.3),
-        98: (16.6, 0.3),
-        104: (8.3, 0.3),
-        105: (1.3, 0.3),
-        106: (1.3, 0.3),
-        112: (1.0, 6.0),
-        124: (4.1, 1.95),
-        125: (5.4, 2),
-        126: (5.4, 2),
-        127: (6.7, 2.3),
-        136: (0.2, 0.2),
-        137: (0.2, 0.2),
-        138: (0.2, 0.2),
-        139: (0.2, 0.2),
-        140: (5.8, 5.8),
-        144: (0.75, 1.75),
-        145: (1.3, 1.3),
-        146: (0.65, 0.65),
-        147: (0.2, 2.5),
-        148: (0.2, 2.5),
-        160: (0.7, 0.7),
-        161: (0.7, 0.7),
-        164: (0.3, 4.8),
-        165: (0.3, 4.8),
-        168: (1.3, 1.3),
-        169: (1.3, 1.3),
-
-
-        # Weitere Indizes und Größen können hier hinzugefügt werden
-    }
-    return object_sizes.get(index, (0.5, 0.5))  # Standardgröße falls Index nicht gefunden wird
+    if 0 <= index < 256:
+        return _OBJECT_SIZE_LUT[index]
+    return (0.5, 0.5)  # Standardgröße falls Index nicht gefunden wird
+
+
+# Eckpunkte im lokalen Koordinatensystem (längs, quer), einmal pro Fahrzeugtyp bzw. Objekt-Index berechnet
+_VEHICLE_CORNERS = {}
+_OBJECT_CORNERS = {}
 
-def create_bboxes_for_own_vehicle(own_vehicle: OwnVehicle):
-    vehicle_size_def = get_vehicle_size(own_vehicle.data.cname)
-    vehicle_size = (vehicle_size_def[1], vehicle_size_def[0])  # switch
-    angle_of_car = (own_vehicle.data.heading + 16384) / 182.05
 
-    perpendicular_angle = angle_of_car + 90
+def _local_corners(height: float, width: float) -> tuple:
+    half_height = height / 2 * 65536
+    half_width = width / 2 * 65536
+    return ((half_height, half_width), (half_height, -half_width),
+            (-half_height, -half_width), (-half_height, half_width))
 
-    (left_side_of_car_x, left_side_of_car_y) = calc_polygon_points(own_vehicle.data.x, own_vehicle.data.y, vehicle_size[0] / 2 * 65536, perpendicular_angle)
 
-    (front_left_x, front_left_y) = calc_polygon_points(left_side_of_car_x, left_side_of_car_y, vehicle_size[1] / 2 * 65536, angle_of_car)
-    (front_middle_x, front_middle_y) = calc_polygon_points(own_vehicle.data.x, own_vehicle.data.y, vehicle_size[1] / 2 * 65536, angle_of_car)
-    (front_right_x, front_right_y) = calc_polygon_points(front_left_x, front_left_y, -vehicle_size[0] * 65536, perpendicular_angle)
+def _place_corners(x: float, y: float, corners: tuple, angle_u16: int) -> list:
+    """Dreht die lokalen Eckpunkte um angle_u16 (LFS 16-Bit-Winkel) und verschiebt sie nach (x, y)"""
+    c, s = trig_u16(angle_u16)
+    return [(x + lx * c - ly * s, y + lx * s + ly * c) for lx, ly in corners]
 
-    (rear_left_x, rear_left_y) = calc_polygon_points(left_side_of_car_x, left_side_of_car_y, -vehicle_size[1] / 2 * 65536, angle_of_car)
-    (rear_middle_x, rear_middle_y) = calc_polygon_points(own_vehicle.data.x, own_vehicle.data.y, -vehicle_size[1] / 2 * 65536, angle_of_car)
-    (rear_right_x, rear_right_y) = calc_polygon_points(rear_left_x, rear_left_y, -vehicle_size[0] * 65536, perpendicular_angle)
+def _bounding_circle(points) -> tuple:
+    """Umkreis eines Polygons (Schwerpunkt der Ecken, größter Eckabstand) als grober Vorfilter"""
+    n = len(points)
+    cx = sum(p[0] for p in points) / n
+    cy = sum(p[1] for p in points) / n
+    radius = math.sqrt(max((px - cx) ** 2 + (py - cy) ** 2 for px, py in points))
+    return cx, cy, radius
+
+
+def _circles_overlap(circle1: tuple, circle2: tuple) -> bool:
+    x1, y1, r1 = circle1
+    x2, y2, r2 = circle2
+    return (x1 - x2) ** 2 + (y1 - y2) ** 2 <= (r1 + r2) ** 2
+
+
+def create_bboxes_for_own_vehicle(own_vehicle: OwnVehicle):
+    vehicle_size_def = get_vehicle_size(own_vehicle.data.cname)
+    vehicle_size = (vehicle_size_def[1], vehicle_size_def[0])  # switch
+    # sin/cos der Fahrzeugausrichtung werden pro Frame in OwnVehicle gecacht
+    (cos_car, sin_car, cos_perp, sin_perp,
+     cos_sensor_1, sin_sensor_1, cos_sensor_2, sin_sensor_2) = own_vehicle.trig_cache
+    own_x = own_vehicle.data.x
+    own_y = own_vehicle.data.y
+    half_width = vehicle_size[0] / 2 * 65536
+    half_length = vehicle_size[1] / 2 * 65536
+    width = vehicle_size[0] * 65536
+
+    left_side_of_car_x = own_x + half_width * cos_perp
+    left_side_of_car_y = own_y + half_width * sin_perp
+
+    front_left_x = left_side_of_car_x + half_length * cos_car
+    front_left_y = left_side_of_car_y + half_length * sin_car
+    front_middle_x = own_x + half_length * cos_car
+    front_middle_y = own_y + half_length * sin_car
+    front_right_x = front_left_x - width * cos_perp
+    front_right_y = front_left_y - width * sin_perp
+
+    rear_left_x = left_side_of_car_x - half_length * cos_car
+    rear_left_y = left_side_of_car_y - half_length * sin_car
+    rear_middle_x = own_x - half_length * cos_car
+    rear_middle_y = own_y - half_length * sin_car
+    rear_right_x = rear_left_x - width * cos_perp
+    rear_right_y = rear_left_y - width * sin_perp
 
-    pdc_sensor_angle = 25
     sensor_distances = [0.1 * 65536, 1.4 * 65536, 2.8 * 65536]
 
     # Polygone für die sensoren ausgehend von den Punkten erstellen
@@ -129,23 +191,18 @@ def create_bboxes_for_own_vehicle(own_vehicle: OwnVehicle):
     for i, point in enumerate([(front_left_x, front_left_y), (front_middle_x, front_middle_y), (front_right_x, front_right_y),
                     (rear_left_x, rear_left_y), (rear_middle_x, rear_middle_y), (rear_right_x, rear_right_y)]):
             (x, y) = point
-            sensor_angle_1 = (angle_of_car + pdc_sensor_angle) % 360
-            sensor_angle_2 = (angle_of_car - pdc_sensor_angle) % 360
 
             for j, distance in enumerate(sensor_distances):
                 if i > 2:
                     distance= -distance  # Negative Werte für die hinteren Sensoren
-                (sensor_1_x, sensor_1_y) = calc_polygon_points(x, y, distance, sensor_angle_1)
-                (sensor_2_x, sensor_2_y) = calc_polygon_points(x, y, distance, sensor_angle_2)
+                sensor = [(x, y), (x + distance * cos_sensor_1, y + distance * sin_sensor_1),
+                          (x + distance * cos_sensor_2, y + distance * sin_sensor_2)]
                 if j == 0:
-                    inner_sensors.append([(x, y), (sensor_1_x, sensor_1_y), (sensor_2_x, sensor_2_y)])
+                    inner_sensors.append(sensor)
                 elif j == 1:
-                    middle_sensors.append([(x, y), (sensor_1_x, sensor_1_y), (sensor_2_x, sensor_2_y)])
+                    middle_sensors.append(sensor)
                 elif j == 2:
-                    outer_sensors.append([(x, y), (sensor_1_x, sensor_1_y), (sensor_2_x, sensor_2_y)])
-
-
-
+                    outer_sensors.append(sensor)
 
     # angle_of_car = abs((own_vehicle.data.heading + 16384) / 182.05)
     # ang1, ang2, ang3, ang4 = angle_of_car - 160, angle_of_car - 20, angle_of_car + 20, angle_of_car + 160
@@ -161,75 +218,61 @@ def create_bboxes_for_own_vehicle(own_vehicle: OwnVehicle):
 def create_rectangle_for_object(x: float, y: float, index: int, heading: float) -> list:
     x = x * 4096 # TODO check if correct for 65536 scale
     y = y * 4096
-    no_hitbox_objects = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 16, 17, 128, 129, 130, 131, 132, 149, 150, 151,
-                         172, 173, 174, 175, 176, 177, 178, 179, 184, 185, 186, 252, 253,
-                         254, 255]  # Objects without hitbox
-    if index not in no_hitbox_objects:
-        height, width = get_object_size(index)
-    else:
+    if index in _NO_HITBOX_OBJECTS:
         return [-1]
-    angle_of_obj = (heading * 360 / 256 + 90) % 360
-
-    ang_perp = angle_of_obj + 90
-    (x1, y1) = calc_polygon_points(x, y, width / 2 * 65536, ang_perp)
-    (x2, y2) = calc_polygon_points(x, y, -width / 2 * 65536, ang_perp)
-    (corner_x, corner_y) = calc_polygon_points(x1, y1, height / 2 * 65536, angle_of_obj)
-    (corner2_x, corner2_y) = calc_polygon_points(x2, y2, height / 2 * 65536, angle_of_obj)
-    (corner3_x, corner3_y) = calc_polygon_points(x2, y2, -height / 2 * 65536, angle_of_obj)
-    (corner4_x, corner4_y) = calc_polygon_points(x1, y1, -height / 2 * 65536, angle_of_obj)
-
-    rectangle_for_object = [(corner_x, corner_y), (corner2_x, corner2_y), (corner3_x, corner3_y),
-                            (corner4_x, corner4_y)]
-    return rectangle_for_object
+    corners = _OBJECT_CORNERS.get(index)
+    if corners is None:
+        corners = _OBJECT_CORNERS[index] = _local_corners(*get_object_size(index))
+    # Objekt-Heading ist 8 Bit (256 = 360°), +90° = +16384 im 16-Bit-System
+    return _place_corners(x, y, corners, heading * 256 + 16384)
 
 def create_rectangle_for_vehicle(x: float, y: float, type: str, heading: float) -> list:
-    height, width = get_vehicle_size(type)
-    # cars use a different heading system than objects, so we need to convert it
-    angle_of_obj = (heading * 360 / 65536 + 90) % 360
-
-    ang_perp = angle_of_obj + 90
-    (x1, y1) = calc_polygon_points(x, y, width / 2 * 65536, ang_perp)
-    (x2, y2) = calc_polygon_points(x, y, -width / 2 * 65536, ang_perp)
-    (corner_x, corner_y) = calc_polygon_points(x1, y1, height / 2 * 65536, angle_of_obj)
-    (corner2_x, corner2_y) = calc_polygon_points(x2, y2, height / 2 * 65536, angle_of_obj)
-    (corner3_x, corner3_y) = calc_polygon_points(x2, y2, -height / 2 * 65536, angle_of_obj)
-    (corner4_x, corner4_y) = calc_polygon_points(x1, y1, -height / 2 * 65536, angle_of_obj)
-
-    rectangle_for_object = [(corner_x, corner_y), (corner2_x, corner2_y), (corner3_x, corner3_y),
-                            (corner4_x, corner4_y)]
-    return rectangle_for_object
+    corners = _VEHICLE_CORNERS.get(type)
+    if corners is None:
+        corners = _VEHICLE_CORNERS[type] = _local_corners(*get_vehicle_size(type))
+    # cars use a 16-bit heading, +90° = +16384
+    return _place_corners(x, y, corners, heading + 16384)
+
+
+
+def _migrate_legacy_rectangles(filename: str):
+    """Übernimmt einmalig eine alte JSON-Array-Datei (gleicher Name mit .json) in die JSON-Lines-Datei"""
+    if os.path.exists(filename):
+        return
+    legacy_filename = os.path.splitext(filename)[0] + '.json'
+    if legacy_filename == filename or not os.path.exists(legacy_filename) or os.path.getsize(legacy_filename) == 0:
+        return
+    try:
+        with open(legacy_filename, 'r') as f:
+            rectangles = json.load(f)
+        if not isinstance(rectangles, list):
+            raise ValueError("keine Rechteck-Liste")
+    except (OSError, ValueError) as e:
+        # Unvollständige/defekte Altdatei beiseitelegen, damit sie nicht bei jedem Aufruf erneut scheitert
+        print(f"Legacy rectangle file {legacy_filename} skipped: {e}")
+        try:
+            os.replace(legacy_filename, legacy_filename + '.corrupt')
+        except OSError:
+            pass
+        return
+    append_json_lines(filename, rectangles)
 
 
+# Grid-IDs: Fahrzeuge nutzen ihre PLID (< 256), statische Objekte liegen darüber in eigenen Bereichen
+_LAYOUT_ID_BASE = 1 << 56  # Layout-Objekte aus AXM-Paketen
+_FILE_ID_BASE = 1 << 57  # aus Datei geladene Rechtecke
 
-def save_rectangles_as_json(rectangles: list, filename: str):
-    """Speichert die Rechtecke als JSON-Datei oder fügt sie zu einer bestehenden Datei hinzu"""
-    import json
-    import os
 
-    # Check if file exists and is not empty
-    if os.path.exists(filename) and os.path.getsize(filename) > 0:
-        # Read existing data
-        try:
-            with open(filename, 'r') as f:
-                existing_data = json.load(f)
+def layout_object_id(obj) -> int:
+    """Eindeutige Grid-ID eines Layout-Objekts aus festen Bitfeldern (Index, Heading, X, Y, Zbyte)"""
+    return (_LAYOUT_ID_BASE | obj.Index << 48 | obj.Heading << 40
+            | (obj.X & 0xFFFF) << 24 | (obj.Y & 0xFFFF) << 8 | obj.Zbyte)
 
-            # Append new rectangles to existing data
-            existing_data.extend(rectangles)
 
-            # Write back the combined data
-            with open(filename, 'w') as f:
-                json.dump(existing_data, f, indent=4)
-
-        except (json.JSONDecodeError, ValueError) as e:
-            print(f"Error reading existing JSON file: {e}")
-            print("Creating new file with current data...")
-            # If there's an error reading the file, create a new one
-            with open(filename, 'w') as f:
-                json.dump(rectangles, f, indent=4)
-    else:
-        # File doesn't exist or is empty, create new file
-        with open(filename, 'w') as f:
-            json.dump(rectangles, f, indent=4)
+def save_rectangles_as_json(rectangles: list, filename: str):
+    """Hängt die Rechtecke an eine JSON-Lines-Datei an (ein Rechteck pro Zeile, ohne die Datei neu einzulesen)"""
+    _migrate_legacy_rectangles(filename)
+    append_json_lines(filename, rectangles)
 
 
 class ParkDistanceControl(AssistanceSystem):
@@ -238,123 +281,105 @@ class ParkDistanceControl(AssistanceSystem):
     def __init__(self, event_bus: EventBus, settings: SettingsManager):
         super().__init__("park_distance_control", event_bus, settings)
         self.detection_distance = 70.0
-        self.pdc_result = {
-            0: -1,
-            1: -1,
-            2: -1,
-            3: -1,
-            4: -1,
-            5: -1
-        }
+        self.pdc_result = list(_PDC_INACTIVE)
+        self._pdc_buffer = list(_PDC_READY)  # wird jeden Tick wiederverwendet
+        self._nearby_ids = []  # Ergebnisliste der Grid-Abfrage, ebenfalls wiederverwendet
         self.last_exec = time.perf_counter()
         self.park_grid = SpatialHashGrid(cell_size=15.0 * 65536)
         self.event_bus.subscribe('layout_received', self._update_axm)
         self.track = "ax"
 
     def load_rectangles_from_json(self, filename: str):
-        """Lädt Rechtecke aus einer JSON-Datei"""
-        import json
+        """Lädt Rechtecke aus einer JSON-Lines-Datei"""
+        _migrate_legacy_rectangles(filename)
         if not os.path.exists(filename):
             return
-        with open(filename, 'r') as f:
-            rectangles = json.load(f)
-        for i, rect in enumerate(rectangles):
-            self.park_grid.insert_object(i, [rect[0], rect[1], rect[2], rect[3]], is_static=True)
+        rects = list(iter_json_lines(filename))
+        self.park_grid.insert_objects_bulk(list(range(_FILE_ID_BASE, _FILE_ID_BASE + len(rects))), rects, is_static=True)
 
     def _update_axm(self, axm):
         """Aktualisiert die AXM-Daten"""
         if axm.PMOAction == pyinsim.PMO_ADD_OBJECTS or axm.PMOAction == pyinsim.PMO_TINY_AXM:
-            print("Updating AXM objects...")
             self._update_axm_track_boundaries(axm)
         elif axm.PMOAction == pyinsim.PMO_DEL_OBJECTS:
             for o in axm.Info:
-                index = int(str(o.Index) + str(abs(o.X)) + str(abs(o.Y)) + str(abs(o.Zbyte)))
-                self.park_grid.remove_object(index)
+                self.park_grid.remove_object(layout_object_id(o))
         elif axm.PMOAction == pyinsim.PMO_CLEAR_ALL:
             self.park_grid.clear()
             self.event_bus.emit("request_axm_update", {})
 
-        #self.load_rectangles_from_json(filename='park_distance_control_rectangles_ax.json')
-        #self.park_grid.plot_grid()
-
 
     def _update_axm_track_boundaries_and_save(self, axm):
-        """Aktualisiert die AXM-Daten"""
+        """Speichert die Streckenbegrenzungen aus den AXM-Daten (nur Persistierung, das Grid bleibt unverändert)"""
         rects = []
         for object in axm.Info:
-            if object.Index == 98 or object.Index == 97 or object.Index == 96: # Armco 1-5
-                rects.append(create_rectangle_for_object(object.X, object.Y, object.Index, object.Heading))
-            elif object.Index == 136: # Post Green
+            if object.Index == 98 or object.Index == 97 or object.Index == 96 or object.Index == 136: # Armco 1-5, Post Green
                 rects.append(create_rectangle_for_object(object.X, object.Y, object.Index, object.Heading))
-        save_rectangles_as_json(rects, 'park_distance_control_rectangles_ax.json')
+        # Anhängen ohne die Datei neu einzulesen, daher kein Hintergrund-Thread nötig
+        save_rectangles_as_json(rects, 'park_distance_control_rectangles_ax.jsonl')
 
     def _update_axm_track_boundaries(self, axm):
         """Aktualisiert die AXM-Daten"""
         rects = []
+        ids = []
         for object in axm.Info:
             rect = create_rectangle_for_object(object.X, object.Y, object.Index, object.Heading)
             if rect[0] != -1:
-                index = int(str(object.Index) + str(abs(object.X)) + str(abs(object.Y)) + str(abs(object.Zbyte)))
-                rects.append([rect, index])
-        print(f"Inserting {len(rects)} AXM objects into spatial grid...")
-        for i, rectangle in enumerate(rects):
-            rect = rectangle[0]
-            self.park_grid.insert_object(rectangle[1], [rect[0], rect[1], rect[2], rect[3]], is_static=True)
-
-    def process(self, own_vehicle: OwnVehicle, vehicles: Dict[int, Vehicle]) -> Dict[int, int]:
+                rects.append(rect)
+                ids.append(layout_object_id(object))
+        self.park_grid.insert_objects_bulk(ids, rects, is_static=True)
+
+    def process(self, own_vehicle: OwnVehicle, vehicles: Dict[int, Vehicle]) -> List[int]:
         """Prüft auf Fahrzeuge im toten Winkel"""
-        new_pdc_result = {
-            0: -1,
-            1: -1,
-            2: -1,
-            3: -1,
-            4: -1,
-            5: -1
-        }
-        if own_vehicle.data.speed < 10 :
-            new_pdc_result = {
-                0: 0,
-                1: 0,
-                2: 0,
-                3: 0,
-                4: 0,
-                5: 0
-            }
-            self.park_grid.clear_dynamic_objects()
-            vehicle_copy = vehicles.copy() # to avoid runtime error for changing dict size during iteration
-            for vehicle in vehicle_copy.values():
-                if vehicle.data.distance_to_player > 15:
-                    self.park_grid.remove_object(vehicle.data.player_id)
+        if own_vehicle.data.speed >= 10:
+            if self.pdc_result[0] != -1:
+                self.pdc_result[:] = _PDC_INACTIVE
+                self.event_bus.emit('pdc_changed', _PDC_INACTIVE)
+            return self.pdc_result
+
+        new_pdc_result = self._pdc_buffer
+        new_pdc_result[:] = _PDC_READY
+        self.park_grid.clear_dynamic_objects()
+        for vehicle in tuple(vehicles.values()):  # snapshot to avoid runtime error for changing dict size during iteration
+            if vehicle.data.distance_to_player > 15:
+                self.park_grid.remove_object(vehicle.data.player_id)
+                continue
+            rectangle = create_rectangle_for_vehicle(vehicle.data.x, vehicle.data.y,
+                                                    vehicle.data.cname, vehicle.data.heading)
+            self.park_grid.insert_object(vehicle.data.player_id, rectangle, is_static=False)
+            #self.park_grid.plot_grid()
+
+        outer_sensors, middle_sensors, inner_sensors = create_bboxes_for_own_vehicle(own_vehicle)
+        nearby = self.park_grid.query_area_ids(own_vehicle.data.x, own_vehicle.data.y, 30 * 65536,
+                                               out=self._nearby_ids)
+        points = self.park_grid.points
+        edges = self.park_grid.edges
+        # Umkreise der Sensoren einmal pro Tick, Polygon-Test nur wenn sich die Umkreise berühren
+        outer_circles = [_bounding_circle(sensor) for sensor in outer_sensors]
+        middle_circles = [_bounding_circle(sensor) for sensor in middle_sensors]
+        inner_circles = [_bounding_circle(sensor) for sensor in inner_sensors]
+        # Die drei Sensorringe eines Sensors sind ineinander geschachtelt (gleiche Spitze und Winkel),
+        # daher reicht ein einziger Durchlauf: innerer Ring wird nur geprüft, wenn der äußere getroffen wurde
+        for obj_id in nearby:
+            obj_points = points[obj_id]
+            obj_edges = edges[obj_id]
+            obj_circle = _bounding_circle(obj_points)
+            for i in range(6):
+                if new_pdc_result[i] == 3:
+                    continue
+                if not (_circles_overlap(outer_circles[i], obj_circle)
+                        and self.park_grid.polygon_overlap(outer_sensors[i], obj_points, obj_edges)):
                     continue
-                rectangle = create_rectangle_for_vehicle(vehicle.data.x, vehicle.data.y,
-                                                        vehicle.data.cname, vehicle.data.heading)
-                self.park_grid.insert_object(vehicle.data.player_id, [rectangle[0], rectangle[1], rectangle[2], rectangle[3]], is_static=False)
-                #self.park_grid.plot_grid()
-
-            outer_sensors, middle_sensors, inner_sensors = create_bboxes_for_own_vehicle(own_vehicle)
-            nearby = self.park_grid.query_area(own_vehicle.data.x, own_vehicle.data.y, 30 * 65536)
-            collisions = []
-            for obj in nearby:
-                for i, sensor in enumerate(outer_sensors):
-                    if self.park_grid.polygon_overlap(sensor, obj['points']):
-                        new_pdc_result[i] = (max(new_pdc_result[i], 1))
-                        collisions.append(obj)
-
-            # Filter secondary collisions for efficiency
-            secondary_collisions = []
-            for obj in collisions:
-                for i, sensor in enumerate(middle_sensors):
-                    if self.park_grid.polygon_overlap(sensor, obj['points']):
-                        new_pdc_result[i] = (max(new_pdc_result[i], 2))
-                        secondary_collisions.append(obj)
-
-            for obj in secondary_collisions:
-                for i, sensor in enumerate(inner_sensors):
-                    if self.park_grid.polygon_overlap(sensor, obj['points']):
-                        new_pdc_result[i] = (max(new_pdc_result[i], 3))
-            #print("New PDC Result:", new_pdc_result)
+                level = 1
+                if (_circles_overlap(middle_circles[i], obj_circle)
+                        and self.park_grid.polygon_overlap(middle_sensors[i], obj_points, obj_edges)):
+                    level = 2
+                    if (_circles_overlap(inner_circles[i], obj_circle)
+                            and self.park_grid.polygon_overlap(inner_sensors[i], obj_points, obj_edges)):
+                        level = 3
+                new_pdc_result[i] = max(new_pdc_result[i], level)
         if self.pdc_result != new_pdc_result:
-            self.event_bus.emit('pdc_changed', new_pdc_result)
-            self.pdc_result = new_pdc_result
+            self.pdc_result[:] = new_pdc_result
+            self.event_bus.emit('pdc_changed', tuple(new_pdc_result))
 
         return self.pdc_result
@@ -1,4 +1,4 @@
-from typing import Dict, List, Callable, Any
+from typing import Dict, Tuple, Callable, Any
 from threading import Lock
 
 
@@ -6,30 +6,31 @@ class EventBus:
     """Zentrale Event-Verteilung zwischen allen Komponenten"""
 
     def __init__(self):
-        self._subscribers: Dict[str, List[Callable]] = {}
+        # Copy-on-write: Handler-Tupel werden nur beim (De-)Registrieren ersetzt,
+        # emit() liest die Referenz ohne Lock
+        self._subscribers: Dict[str, Tuple[Callable, ...]] = {}
         self._lock = Lock()
 
     def subscribe(self, event_type: str, callback: Callable):
         """Registriert einen Event-Handler"""
         with self._lock:
-            if event_type not in self._subscribers:
-                self._subscribers[event_type] = []
-            self._subscribers[event_type].append(callback)
+            self._subscribers[event_type] = self._subscribers.get(event_type, ()) + (callback,)
 
     def unsubscribe(self, event_type: str, callback: Callable):
         """Entfernt einen Event-Handler"""
         with self._lock:
             if event_type in self._subscribers:
-                self._subscribers[event_type].remove(callback)
+                subscribers = list(self._subscribers[event_type])
+                subscribers.remove(callback)
+                self._subscribers[event_type] = tuple(subscribers)
+
+    def has_subscribers(self, event_type: str) -> bool:
+        """Prüft, ob für ein Event mindestens ein Handler registriert ist"""
+        return bool(self._subscribers.get(event_type))
 
     def emit(self, event_type: str, data: Any = None):
         """Sendet ein Event an alle registrierten Handler"""
-        subscribers = []
-        with self._lock:
-            if event_type in self._subscribers:
-                subscribers = self._subscribers[event_type].copy()
-
-        for callback in subscribers:
+        for callback in self._subscribers.get(event_type, ()):
             #try:
                 callback(data)
                 #print(f"Event '{event_type}' emitted with data: {data}")
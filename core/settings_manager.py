@@ -1,14 +1,22 @@
-import json
+import atexit
 import os
-from typing import Any, Dict
-from misc.helpers import resolve_path
+import threading
+from typing import Any, Dict, Optional
+from misc.helpers import resolve_path, read_json, write_json
 
 class SettingsManager:
     """Verwaltet alle Einstellungen mit Persistierung"""
 
+    SAVE_DELAY = 1.0  # Sekunden, mehrere set()-Aufrufe werden zu einem Schreibvorgang zusammengefasst
+
     def __init__(self, settings_file: str = "settings.json"):
         self.settings_file = resolve_path(settings_file)
         self._settings: Dict[str, Any] = {}
+        self._dirty = False
+        self._flush_timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+        # Der Timer ist ein Daemon-Thread, ausstehende Änderungen auch bei anderem Programmende schreiben
+        atexit.register(self.flush)
         self._defaults: Dict[str, Any] = {
             'forward_collision_warning': True,
             'blind_spot_warning': True,
@@ -34,6 +42,7 @@ class SettingsManager:
             'hud_height': 119,
             'hud_width': 90,
             'hud_active': True,
+            'audio_buffer': 1024,  # Mixer-Puffer in Samples: kleiner = weniger Latenz, größer = stabiler
 
             'user_handbrake_key': "q",
             'user_shift_up_key': "s",
@@ -59,17 +68,31 @@ class SettingsManager:
         return self._settings.get(key, default if default is not None else self._defaults.get(key))
 
     def set(self, key: str, value: Any):
-        """Setzt einen Einstellungswert"""
-        print(f"Setting {key} to {value}")
-        self._settings[key] = value
-        self.save()
+        """Setzt einen Einstellungswert, gespeichert wird verzögert im Hintergrund"""
+        with self._lock:
+            self._settings[key] = value
+            self._dirty = True
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.SAVE_DELAY, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush(self):
+        """Schreibt ausstehende Änderungen sofort in die Datei"""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+            self.save()
 
     def load(self):
         """Lädt Einstellungen aus Datei"""
         if os.path.exists(self.settings_file):
             try:
-                with open(self.settings_file, 'r') as f:
-                    self._settings = json.load(f)
+                self._settings = read_json(self.settings_file)
             except Exception as e:
                 print(f"Error loading settings: {e}")
                 self._settings = self._defaults.copy()
@@ -79,7 +102,8 @@ class SettingsManager:
     def save(self):
         """Speichert Einstellungen in Datei"""
         try:
-            with open(self.settings_file, 'w') as f:
-                json.dump(self._settings, f, indent=2)
+            tmp_file = self.settings_file + '.tmp'
+            write_json(tmp_file, self._settings)
+            os.replace(tmp_file, self.settings_file)
         except Exception as e:
             print(f"Error saving settings: {e}")
\ No newline at end of file
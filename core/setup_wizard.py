@@ -3,22 +3,23 @@ Setup Wizard for LFS Assistant Add-on.
 Guides the user through first-time configuration of LFS (cfg.txt, InSim autostart).
 """
 
+import functools
 import glob
 import os
 import re
 import shutil
+import stat
 import tkinter as tk
 from tkinter import filedialog, messagebox
 
-import psutil
-
-from misc.helpers import resolve_path
+from misc.helpers import resolve_path, is_process_running, LFS_EXE
 
 # --- Constants ---
 
+@functools.cache
 def _get_flag_file_path() -> str:
     """Returns the path to the setup flag file, next to the executable or project root."""
-    return resolve_path('.setup_done')
+    return os.path.normpath(resolve_path('.setup_done'))
 
 DEFAULT_LFS_CFG_PATH = r"C:\LFS\cfg.txt"
 
@@ -36,8 +37,14 @@ REQUIRED_CFG_SETTINGS = {
     "OutGauge ID": "0",
 }
 
+# Matches lines like "OutSim Mode 2" — one of the keys at start, then whitespace, then value
+_CFG_KEY_RE = re.compile(r'^(' + '|'.join(re.escape(key) for key in REQUIRED_CFG_SETTINGS) + r')\s')
+
 INSIM_AUTOEXEC_LINE = "/insim 29999"
 
+# Read/write buffer for cfg.txt — large enough to hold a typical file in one go
+_IO_BUFFER_SIZE = 1 << 16
+
 # Directory containing the bundled .lyt layout files (relative to this file)
 def _get_layouts_dir() -> str:
     """Returns the path to the layouts directory, relative to EXE or project root."""
@@ -46,13 +53,10 @@ def _get_layouts_dir() -> str:
 
 def is_first_run() -> bool:
     """Check whether the setup has already been completed."""
-    flag = _get_flag_file_path()
-    if not os.path.isfile(flag):
-        return True
     try:
-        with open(flag, 'r', encoding='utf-8') as f:
-            return f.read().strip().lower() != 'true'
-    except OSError:
+        with open(_get_flag_file_path(), 'rb') as f:
+            return f.read(8).strip().lower() != b'true'
+    except OSError:  # also covers a missing flag file
         return True
 
 
@@ -65,79 +69,82 @@ def mark_setup_done():
 
 
 def _is_lfs_running() -> bool:
-    for proc in psutil.process_iter(['name']):
-        try:
-            if proc.info['name'] and proc.info['name'].lower() == 'lfs.exe':
-                return True
-        except (psutil.AccessDenied, psutil.NoSuchProcess):
-            continue
-    return False
+    # is_process_running caches its result for PROCESS_CHECK_TTL, so wizard steps share one scan
+    return is_process_running(LFS_EXE)
+
+
+def _find_default_cfg():
+    """Return (cfg_path, lfs_dir) for the default install location, or None if cfg.txt is missing."""
+    try:
+        st = os.stat(DEFAULT_LFS_CFG_PATH)
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    return DEFAULT_LFS_CFG_PATH, os.path.dirname(DEFAULT_LFS_CFG_PATH)
 
 
 # ---------------------------------------------------------------------------
 # cfg.txt helpers
 # ---------------------------------------------------------------------------
 
-def _read_cfg(path: str) -> list[str]:
-    with open(path, 'r', encoding='utf-8') as f:
-        return f.readlines()
-
-
-def _write_cfg(path: str, lines: list[str]):
-    with open(path, 'w', encoding='utf-8') as f:
-        f.writelines(lines)
-
-
 def apply_cfg_settings(cfg_path: str):
     """
     Modify cfg.txt so that all REQUIRED_CFG_SETTINGS are present with the
     correct values. Existing lines are updated in-place; missing keys are
     appended at the end.
+
+    The file is streamed line by line into a temporary file which then
+    atomically replaces cfg.txt, so a crash never leaves a half-written config.
     """
-    lines = _read_cfg(cfg_path)
     remaining_keys = dict(REQUIRED_CFG_SETTINGS)  # keys still to handle
+    tmp_path = cfg_path + '.tmp'
 
-    new_lines: list[str] = []
-    for line in lines:
-        stripped = line.rstrip('\n').rstrip('\r')
-        matched = False
-        for key in list(remaining_keys.keys()):
-            # Match lines like "OutSim Mode 2" — key at start, then whitespace, then value
-            pattern = rf'^{re.escape(key)}\s+'
-            if re.match(pattern, stripped):
-                new_lines.append(f"{key} {remaining_keys[key]}\n")
-                del remaining_keys[key]
-                matched = True
-                break
-        if not matched:
-            new_lines.append(line if line.endswith('\n') else line + '\n')
+    try:
+        with open(cfg_path, 'r', encoding='utf-8', buffering=_IO_BUFFER_SIZE) as src, \
+                open(tmp_path, 'w', encoding='utf-8', buffering=_IO_BUFFER_SIZE) as dst:
+            for line in src:
+                stripped = line.rstrip('\n').rstrip('\r')
+                match = _CFG_KEY_RE.match(stripped)
+                if match and match.group(1) in remaining_keys:
+                    key = match.group(1)
+                    dst.write(f"{key} {remaining_keys.pop(key)}\n")
+                else:
+                    dst.write(line if line.endswith('\n') else line + '\n')
 
-    # Append any settings that were not already present
-    for key, value in remaining_keys.items():
-        new_lines.append(f"{key} {value}\n")
+            # Append any settings that were not already present
+            for key, value in remaining_keys.items():
+                dst.write(f"{key} {value}\n")
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
 
-    _write_cfg(cfg_path, new_lines)
+    os.replace(tmp_path, cfg_path)
 
 
 def add_insim_autoexec(lfs_dir: str):
     # TODO also add /exec to automatically start the assistant on lfs launch!
     """Append '/insim 29999' to data/script/autoexec.lfs if not already present."""
     autoexec_path = os.path.join(lfs_dir, 'data', 'script', 'autoexec.lfs')
-    os.makedirs(os.path.dirname(autoexec_path), exist_ok=True)
+    parent = os.path.dirname(autoexec_path)
+    if not os.path.isdir(parent):
+        os.makedirs(parent, exist_ok=True)
 
-    existing = ""
-    if os.path.isfile(autoexec_path):
-        with open(autoexec_path, 'r', encoding='utf-8') as f:
+    existing = b""
+    if os.path.exists(autoexec_path):
+        with open(autoexec_path, 'rb') as f:
             existing = f.read()
 
-    if INSIM_AUTOEXEC_LINE in existing:
+    line = INSIM_AUTOEXEC_LINE.encode()
+    if line in existing:
         return  # already present
 
-    with open(autoexec_path, 'a', encoding='utf-8') as f:
+    with open(autoexec_path, 'ab') as f:
         # Ensure we start on a new line
-        if existing and not existing.endswith('\n'):
-            f.write('\n')
-        f.write(INSIM_AUTOEXEC_LINE + '\n')
+        if existing and not existing.endswith(b'\n'):
+            f.write(b'\n')
+        f.write(line + b'\n')
 
 
 def copy_layout_files(lfs_dir: str) -> int:
@@ -217,6 +224,8 @@ class SetupWizard:
             self.info_label.config(
                 text="You need to close LFS to run this setup.\nWaiting for you to close LFS…"
             )
+            # Re-check as soon as the user switches back to the wizard
+            self.root.bind('<FocusIn>', self._on_focus_in)
             self._poll_lfs_closed()
         else:
             self._step_find_cfg()
@@ -227,18 +236,26 @@ class SetupWizard:
             self._poll_id = self.root.after(2000, self._poll_lfs_closed)
         else:
             self._poll_id = None
+            self.root.unbind('<FocusIn>')
             self.info_label.config(text="")
             self._step_find_cfg()
 
+    def _on_focus_in(self, _event):
+        """Poll immediately when the wizard regains focus instead of waiting for the timer."""
+        if self._poll_id is not None:
+            self.root.after_cancel(self._poll_id)
+            self._poll_id = None
+            self._poll_lfs_closed()
+
     def _step_find_cfg(self):
         """Step: Locate cfg.txt automatically or let the user browse."""
         self.status_label.config(text="Looking for LFS installation…")
         self.info_label.config(text="")
         self._clear_buttons()
 
-        if os.path.isfile(DEFAULT_LFS_CFG_PATH):
-            self.cfg_path = DEFAULT_LFS_CFG_PATH
-            self.lfs_dir = os.path.dirname(DEFAULT_LFS_CFG_PATH)
+        found = _find_default_cfg()
+        if found is not None:
+            self.cfg_path, self.lfs_dir = found
             self.status_label.config(text="LFS installation found!")
             self.path_var.set(self.cfg_path)
             self.root.after(400, self._step_show_apply_button)
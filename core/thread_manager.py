@@ -1,6 +1,7 @@
+import heapq
 import threading
 import time
-from typing import Dict, List, Callable
+from typing import Dict, List, Callable, Optional, Tuple
 from core.event_bus import EventBus
 
 
@@ -20,48 +21,60 @@ class ThreadManager:
 
     def __init__(self, event_bus: EventBus):
         self.event_bus = event_bus
-        self._tasks: Dict[int, List[ScheduledTask]] = {}  # interval -> tasks
-        self._threads: Dict[int, threading.Thread] = {}
+        # interval -> tasks; nur vor start() befüllt, danach unveränderlich
+        self._tasks: Dict[int, Tuple[ScheduledTask, ...]] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._schedule: List[Tuple[float, int, int]] = []  # Heap aus (deadline, seq, interval)
         self._running = False
-        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
 
     def add_task(self, task: ScheduledTask):
-        """Fügt eine neue geplante Aufgabe hinzu"""
-        with self._lock:
-            interval = task.interval_ms
-            if interval not in self._tasks:
-                self._tasks[interval] = []
-            self._tasks[interval].append(task)
+        """Fügt eine neue geplante Aufgabe hinzu (nur vor start())"""
+        assert not self._running, "add tasks before start()"
+        interval = task.interval_ms
+        self._tasks[interval] = self._tasks.get(interval, ()) + (task,)
 
     def start(self):
-        """Startet alle Thread-Zyklen"""
+        """Startet den Scheduler-Thread"""
         self._running = True
-        for interval in self._tasks.keys():
-            thread = threading.Thread(target=self._run_cycle, args=(interval,))
-            thread.daemon = True
-            self._threads[interval] = thread
-            thread.start()
+        self._stop_event.clear()
+        # Aufgaben mit gleichem Intervall teilen sich einen Heap-Eintrag
+        now = time.monotonic()
+        self._schedule = [(now, seq, interval) for seq, interval in enumerate(self._tasks)]
+        heapq.heapify(self._schedule)
+        self._thread = threading.Thread(target=self._run_scheduler)
+        self._thread.daemon = True
+        self._thread.start()
 
     def stop(self):
-        """Stoppt alle Threads"""
+        """Stoppt den Scheduler-Thread"""
         self._running = False
-        for thread in self._threads.values():
-            thread.join(timeout=1.0)
+        self._stop_event.set()  # weckt den wartenden Scheduler sofort auf
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
 
-    def _run_cycle(self, interval_ms: int):
-        """Führt einen Thread-Zyklus aus"""
-        while self._running:
-            start_time = time.time()
+    def _run_scheduler(self):
+        """
+        Führt die jeweils fällige Intervall-Gruppe aus und plant sie neu ein.
+        Alle Gruppen laufen nacheinander auf diesem einen Thread: eine langsame Aufgabe verzögert
+        auch die übrigen Gruppen, Fehler werden daher pro Aufgabe abgefangen.
+        """
+        schedule = self._schedule
+        while self._running and schedule:
+            deadline, seq, interval_ms = schedule[0]
+            wait_time = deadline - time.monotonic()
+            if wait_time > 0 and self._stop_event.wait(wait_time):
+                return
 
-            for task in self._tasks.get(interval_ms, []):
+            start_time = time.monotonic()
+            for task in self._tasks[interval_ms]:
                 if task.enabled:
-                    #try:
+                    try:
                         task.callback()
                         task.last_execution = start_time
-                    #except Exception as e:
-                        #print(f"Error in task {task.name}: {e}")
+                    except Exception as e:
+                        print(f"Error in task {task.name}: {e}")
 
-            # Warte bis zum nächsten Zyklus
-            elapsed = (time.time() - start_time) * 1000
-            sleep_time = max(0.0, (interval_ms - elapsed) / 1000.0)
-            time.sleep(sleep_time)
+            # Bei Überlast keine verpassten Zyklen nachholen
+            next_deadline = max(deadline + interval_ms / 1000.0, time.monotonic())
+            heapq.heapreplace(schedule, (next_deadline, seq, interval_ms))
@@ -1,5 +1,6 @@
+import functools
 import pyinsim
-from typing import Dict, Any, Callable
+from typing import Any, Callable, Tuple
 import time
 
 from AI_Control import AICarController
@@ -8,6 +9,34 @@ from core.settings_manager import SettingsManager
 from lfs.lfs_state import StateHandler
 from misc import helpers
 
+# Index = light_id -> (SET_flag, MASK_flag)
+_LIGHT_CONFIG = (
+    (pyinsim.LCL_SET_LIGHTS, pyinsim.LCL_Mask_SideLight),      # 0 Standlicht
+    (pyinsim.LCL_SET_LIGHTS, pyinsim.LCL_Mask_LowBeam),        # 1 Abblendlicht
+    (pyinsim.LCL_SET_LIGHTS, pyinsim.LCL_Mask_HighBeam),       # 2 Fernlicht
+    (pyinsim.LCL_SET_FOG_FRONT, pyinsim.LCL_Mask_FogFront),    # 3 Nebelscheinwerfer
+    (pyinsim.LCL_SET_FOG_REAR, pyinsim.LCL_Mask_FogRear),      # 4 Nebelschlussleuchte
+    (pyinsim.LCL_SET_EXTRA, pyinsim.LCL_Mask_Extra),           # 5 Extra
+    (pyinsim.LCL_SET_SIGNALS, pyinsim.LCL_Mask_Left),          # 6 Blinker links
+    (pyinsim.LCL_SET_SIGNALS, pyinsim.LCL_Mask_Right),         # 7 Blinker rechts
+    (pyinsim.LCL_SET_SIGNALS, pyinsim.LCL_Mask_Signals),       # 8 Warnblinkanlage
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _encode_btn_text(text: str) -> bytes:
+    """Kodiert Button-Text (latin-1, sonst UTF-8); HUD-Texte wiederholen sich ständig"""
+    try:
+        return text.encode("latin-1")
+    except UnicodeEncodeError:
+        return text.encode()
+
+
+@functools.lru_cache(maxsize=64)
+def encode_command(command: str) -> bytes:
+    """Kodiert einen dynamisch zusammengesetzten LFS-Befehl einmalig zu bytes"""
+    return command.encode()
+
 
 class LFSConnector:
     """Verwaltet die Verbindung zu Live for Speed"""
@@ -20,7 +49,7 @@ class LFSConnector:
         self.outgauge = None
         self.outsim = None
         self.is_connected = False
-        self._packet_handlers: Dict[int, Callable] = {}
+        self._packet_handlers: Tuple[Tuple[int, Callable], ...] = ()
         self._setup_handlers()
         self.event_bus.subscribe("send_light_command", self.send_light_command)
         self.event_bus.subscribe("request_axm_update", self._request_axm_update)
@@ -47,15 +76,16 @@ class LFSConnector:
 
         self.state_handler = StateHandler(self)
 
-        self._packet_handlers = {
-            pyinsim.ISP_NPL: self._handle_new_player,
-            pyinsim.ISP_PLL: self._handle_player_left,
-            pyinsim.ISP_STA: self._handle_state,
-            pyinsim.ISP_BTC: self._handle_button_click,
-            pyinsim.ISP_MSO: self._handle_message,
-            pyinsim.ISP_MCI: self._handle_mci,
-            pyinsim.ISP_AXM: self._handle_layout,
-        }
+        self._packet_handlers = (
+            (pyinsim.ISP_NPL, self._handle_new_player),
+            (pyinsim.ISP_PLL, self._handle_player_left),
+            (pyinsim.ISP_STA, self._handle_state),
+            (pyinsim.ISP_BTC, self._handle_button_click),
+            (pyinsim.ISP_BFN, self._handle_button_function),
+            (pyinsim.ISP_MSO, self._handle_message),
+            (pyinsim.ISP_MCI, self._handle_mci),
+            (pyinsim.ISP_AXM, self._handle_layout),
+        )
 
     def connect(self):
         """Stellt Verbindung zu LFS her"""
@@ -71,11 +101,13 @@ class LFSConnector:
             )
 
             # Registriere alle Handler
-            for packet_type, handler in self._packet_handlers.items():
+            for packet_type, handler in self._packet_handlers:
                 self.insim.bind(packet_type, handler)
 
             self.start_outgauge()
-            self.start_outsim()
+            # OutSim-Pakete kommen jeden Frame - Listener nur starten, wenn jemand sie auswertet
+            if self.event_bus.has_subscribers('outsim_data'):
+                self.start_outsim()
 
             self.is_connected = True
             self.event_bus.emit('lfs_connected')
@@ -124,9 +156,15 @@ class LFSConnector:
         """Verarbeitet Button-Klicks"""
         self.event_bus.emit('button_clicked', btc)
 
+    def _handle_button_function(self, insim, bfn):
+        """Meldet, wenn der Nutzer die Buttons gelöscht (SHIFT+I) oder angefordert hat"""
+        if bfn.SubT in (pyinsim.BFN_USER_CLEAR, pyinsim.BFN_REQUEST):
+            self.event_bus.emit('buttons_cleared', bfn)
+
     def _handle_message(self, insim, mso):
         """Verarbeitet Chat-Nachrichten"""
-        print(mso.Msg)
+        if self.debug:
+            print(mso.Msg)
         self.event_bus.emit('message_received', mso)
 
     def _handle_layout(self, insim, axm):
@@ -141,9 +179,8 @@ class LFSConnector:
         """Handler für OutSim-Pakete"""
         self.event_bus.emit('outsim_data', packet)
 
-    def send_command_to_lfs(self, command: str):
+    def send_command_to_lfs(self, command: bytes):
         """Sendet einen Befehl an LFS"""
-        command = command.encode()
         self.insim.send(pyinsim.ISP_MST,
                         Msg=command)
 
@@ -163,24 +200,11 @@ class LFSConnector:
         """
         light = data['light']
         on = data['on']
-        # Mapping: light_id -> (SET_flag, MASK_flag)
-        light_config = {
-            0: (pyinsim.LCL_SET_LIGHTS, pyinsim.LCL_Mask_SideLight),      # Standlicht
-            1: (pyinsim.LCL_SET_LIGHTS, pyinsim.LCL_Mask_LowBeam),        # Abblendlicht
-            2: (pyinsim.LCL_SET_LIGHTS, pyinsim.LCL_Mask_HighBeam),       # Fernlicht
-            3: (pyinsim.LCL_SET_FOG_FRONT, pyinsim.LCL_Mask_FogFront),    # Nebelscheinwerfer
-            4: (pyinsim.LCL_SET_FOG_REAR, pyinsim.LCL_Mask_FogRear),      # Nebelschlussleuchte
-            5: (pyinsim.LCL_SET_EXTRA, pyinsim.LCL_Mask_Extra),           # Extra
-            6: (pyinsim.LCL_SET_SIGNALS, pyinsim.LCL_Mask_Left),          # Blinker links
-            7: (pyinsim.LCL_SET_SIGNALS, pyinsim.LCL_Mask_Right),         # Blinker rechts
-            8: (pyinsim.LCL_SET_SIGNALS, pyinsim.LCL_Mask_Signals),       # Warnblinkanlage
-        }
-
-        if light not in light_config:
+        if not 0 <= light < len(_LIGHT_CONFIG):
             print("DEBUG: CAUTION: Invalid light ID")
             return
 
-        set_flag, mask_flag = light_config[light]
+        set_flag, mask_flag = _LIGHT_CONFIG[light]
         UVal = set_flag | (mask_flag if on else 0)
 
         self.insim.send(pyinsim.ISP_SMALL, SubT=pyinsim.SMALL_LCL, UVal=UVal)
@@ -188,10 +212,7 @@ class LFSConnector:
     def send_button(self, click_id: int, style: int, t: int, l: int, w: int, h: int, text: str, inst: int = 0):
         """Sendet einen Button an LFS (T < 170 überlappt UI von LFS)"""
         # print(f"ClickID: {click_id}, Style: {style}, Position: ({t}, {l}), Size: ({w}, {h}), Text: '{text}'")
-        try:
-            text = text.encode("latin-1")
-        except UnicodeEncodeError:
-            text = text.encode()
+        text = _encode_btn_text(text)
         if self.insim and self.is_connected:
             self.insim.send(
                 pyinsim.ISP_BTN,
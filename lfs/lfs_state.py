@@ -39,13 +39,8 @@ class StateHandler:
         flags_raw = sta.Flags
         self.in_game_cam = sta.InGameCam
 
-        ISS_GAME = 1
-        ISS_DIALOG = 16
-        ISS_FRONT_END = 256
-        ISS_TEXT_ENTRY = 32768
-
-        is_in_game = bool(flags_raw & ISS_GAME)
-        is_front_end = bool(flags_raw & ISS_FRONT_END)
+        is_in_game = bool(flags_raw & pyinsim.ISS_GAME)
+        is_front_end = bool(flags_raw & pyinsim.ISS_FRONT_END)
 
         # on_track is True when ISS_GAME is set AND ISS_FRONT_END (entry screen) is NOT set.
         # ISS_DIALOG (in-game options menu) must NOT affect on_track.
@@ -56,8 +51,8 @@ class StateHandler:
         elif self.on_track and not game:
             start_menu_insim()
 
-        self.text_entry = bool(flags_raw & ISS_TEXT_ENTRY)
-        self.dialog = bool(flags_raw & ISS_DIALOG)
+        self.text_entry = bool(flags_raw & pyinsim.ISS_TEXT_ENTRY)
+        self.dialog = bool(flags_raw & pyinsim.ISS_DIALOG)
         self.track = sta.Track
         state_data = {
             'on_track': self.on_track,
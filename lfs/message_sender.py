@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, Set, Tuple
 from lfs.connector import LFSConnector
 
 
@@ -7,12 +7,16 @@ class MessageSender:
 
     def __init__(self, connector: LFSConnector):
         self.connector = connector
-        self.active_buttons: Dict[int, bool] = {}
+        self.active_buttons: Set[int] = set()
+        # button_id -> (style, t, l, w, h, text) des zuletzt gesendeten Buttons
+        self._last_state: Dict[int, Tuple] = {}
+        self.connector.event_bus.subscribe("buttons_cleared", self._on_buttons_cleared)
+        self.connector.event_bus.subscribe("lfs_connected", self._on_buttons_cleared)
         self.connector.event_bus.subscribe("send_command_to_lfs", self._on_send_command_to_lfs)
         self.connector.event_bus.subscribe("send_local_message_to_lfs", self.send_local_message)
 
 
-    def _on_send_command_to_lfs(self, command: str):
+    def _on_send_command_to_lfs(self, command: bytes):
         """Event-Handler für das Senden von Befehlen an LFS"""
         self.send_command(command)
 
@@ -20,18 +24,30 @@ class MessageSender:
         """Sendet eine Chat-Nachricht"""
         self.connector.send_local_message_to_lfs(message)
 
-    def send_command(self, command: str):
+    def send_command(self, command: bytes):
         """Sendet einen Befehl an LFS"""
         self.connector.send_command_to_lfs(command)
 
     def create_button(self, button_id: int, x: int, y: int, width: int, height: int,
                       text: str, style: int = 0):
-        """Erstellt einen Button"""
+        """Erstellt einen Button (sendet nur, wenn er sich seit dem letzten Mal geändert hat)"""
+        state = (style, y, x, width, height, text)
+        if self._last_state.get(button_id) == state:
+            return
         self.connector.send_button(button_id, style, y, x, width, height, text)
-        self.active_buttons[button_id] = True
+        # Ohne Verbindung verwirft der Connector das Paket, dann nicht als gesendet merken
+        if self.connector.insim and self.connector.is_connected:
+            self._last_state[button_id] = state
+        self.active_buttons.add(button_id)
 
     def remove_button(self, button_id: int):
         """Entfernt einen Button"""
-        if self.active_buttons.get(button_id, False):
+        if button_id in self.active_buttons:
             self.connector.delete_button(button_id)
-            self.active_buttons[button_id] = False
\ No newline at end of file
+            self.active_buttons.discard(button_id)
+            self._last_state.pop(button_id, None)
+
+    def _on_buttons_cleared(self, data=None):
+        """LFS hat die Buttons entfernt oder neu verbunden - beim nächsten Frame alles neu senden"""
+        self.active_buttons.clear()
+        self._last_state.clear()
\ No newline at end of file
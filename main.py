@@ -28,27 +28,7 @@ class LFSAssistantApp:
         self.event_bus = EventBus()
         self.settings = SettingsManager()
         self.thread_manager = ThreadManager(self.event_bus)
-        backoff = 1
-        while not helpers.is_lfs_running():
-            if backoff > 60:
-                sys.exit("LFS is not running")
-            print(f"LFS is not running, checking again in {backoff} seconds...")
-            time.sleep(backoff)
-            backoff *= 2
-
-
-        is_connected = False
-        test = LfsConnectionTest()
-        backoff = 2
-        while not is_connected:
-            print("Trying to connect to LFS...")
-            is_connected = test.run_test()
-            if not is_connected:
-                print(f"Connection failed, retrying in {backoff} seconds...")
-                time.sleep(backoff)
-                backoff *= 2
-                if backoff > 60:
-                    sys.exit("Connection failed")
+        self._wait_for_lfs()
 
         # LFS-Kommunikation
         self.lfs_connector = LFSConnector(self.event_bus, self.settings)
@@ -73,6 +53,27 @@ class LFSAssistantApp:
         # Scheduled Tasks hinzufügen
         self._setup_scheduled_tasks()
 
+    def _wait_for_lfs(self, timeout: float = 120):
+        """Wartet mit Backoff, bis LFS läuft und InSim antwortet (ein gemeinsames Zeitbudget)"""
+        deadline = time.monotonic() + timeout
+        backoff = 1
+        test = None
+        while True:
+            if test is None and helpers.is_lfs_running():
+                test = LfsConnectionTest()
+            if test is not None:
+                print("Trying to connect to LFS...")
+                if test.run_test():
+                    return
+                print(f"Connection failed, retrying in {backoff} seconds...")
+            else:
+                print(f"LFS is not running, checking again in {backoff} seconds...")
+
+            if time.monotonic() + backoff > deadline:
+                sys.exit("LFS is not running" if test is None else "Connection failed")
+            time.sleep(backoff)
+            backoff *= 2
+
     def _setup_event_handlers(self):
         """Registriert globale Event-Handler"""
         self.event_bus.subscribe('lfs_connected', self._on_lfs_connected)
@@ -133,6 +134,7 @@ class LFSAssistantApp:
         """Fährt die Anwendung sauber herunter"""
         print("Shutting down LFS Assistant...")
         self.thread_manager.stop()
+        self.settings.flush()
         if self.lfs_connector.insim:
             # Cleanup LFS connection
             pass
@@ -1,3 +1,5 @@
+import glob
+import os
 import time
 
 from core.event_bus import EventBus
@@ -14,30 +16,46 @@ class AudioPlayer():
         self.event_bus = event_bus
         self.settings = settings
         self.event_bus.subscribe('play_audio', self._update_audio_queue)
-        self.last_played_audio = [] # list that stores sounds played withing the last 3 seconds
-        self.no_multiple_playback_audios = ["fcw"]
+        self._blocked_until = {}  # audio_file -> perf_counter time until which it must not play again
+        self.no_multiple_playback_audios = {"fcw"}
+        pygame.mixer.pre_init(44100, -16, 2, self.settings.get('audio_buffer'))
         pygame.mixer.init()
+        self._sounds = self._load_sounds()
+        self._failed_sounds = set()  # reported once, then skipped silently
+
+    def _load_sounds(self):
+        """Loads and decodes all audio/*.wav files once, keyed by file name without extension."""
+        sounds = {}
+        for path in glob.glob(os.path.join(resolve_path("audio"), "*.wav")):
+            try:
+                sounds[os.path.splitext(os.path.basename(path))[0]] = pygame.mixer.Sound(path)
+            except Exception as e:
+                print(f"Error loading audio file {path}: {e}")
+        return sounds
 
     def _update_audio_queue(self, event):
         """Updates the audio playback queue based on events."""
         audio_file = event.get('audio_file')
         if audio_file:
-            # Clean up last_played_audio list
+            if audio_file in self.no_multiple_playback_audios:
+                # Sounds in this set play at most once within 3 seconds
+                now = time.perf_counter()
+                if self._blocked_until.get(audio_file, 0.0) > now:
+                    return
+                self._blocked_until[audio_file] = now + 3
 
-            self.last_played_audio = [item for item in self.last_played_audio if item[1] + 3 > time.perf_counter()]
-            last_played_files = [item[0] for item in self.last_played_audio]
-            can_be_played = audio_file in self.no_multiple_playback_audios and audio_file not in last_played_files
-            if can_be_played or audio_file not in self.no_multiple_playback_audios:
-                if audio_file in self.no_multiple_playback_audios:
-                    self.last_played_audio.append([audio_file, time.perf_counter()])
-
-                self._play_audio(audio_file)
+            self._play_audio(audio_file)
 
 
     def _play_audio(self, audio_file):
-        # Play audio using pygame
+        # Play audio using pygame; every audio/*.wav was loaded at startup
+        sound = self._sounds.get(audio_file)
+        if sound is None:
+            if audio_file not in self._failed_sounds:
+                self._failed_sounds.add(audio_file)
+                print(f"Error playing audio file {audio_file}: no such sound in audio/")
+            return
         try:
-            sound = pygame.mixer.Sound(resolve_path("audio", f"{audio_file}.wav"))
             sound.play()
         except Exception as e:
             print(f"Error playing audio file {audio_file}: {e}")
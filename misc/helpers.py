@@ -1,9 +1,16 @@
+import json
 import math
 import os
 import sys
+import time
 
 import psutil
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def get_base_dir() -> str:
     """Return the project root directory.
@@ -24,38 +31,189 @@ def resolve_path(*parts: str) -> str:
     return os.path.join(get_base_dir(), *parts)
 
 
-def is_lfs_running():
-    for proc in psutil.process_iter():
-        try:
-            if proc.name() == "LFS.exe":
-                print("LFS.exe seems to be running. Starting!\n\n")
-                return True
+def read_json(path: str):
+    """Load a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
 
-        except psutil.AccessDenied:
-            print(
-                "It seems like you do not have sufficient permissions to check for System Apps. Cannot automatically detect if LFS is running!")
-            return True
 
-    return False
+def write_json(path: str, data):
+    """Write *data* as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2)
 
 
-def is_spotify_running():
-    for proc in psutil.process_iter():
+def append_json_lines(path: str, items):
+    """Append every item as one JSON line (JSON Lines) without reading the existing file."""
+    if orjson is not None:
+        with open(path, 'ab') as f:
+            f.write(b''.join(orjson.dumps(item) + b'\n' for item in items))
+        return
+    with open(path, 'a') as f:
+        f.write(''.join(json.dumps(item) + '\n' for item in items))
+
+
+def iter_json_lines(path: str):
+    """Yield the items of a JSON Lines file one by one, skipping empty lines."""
+    loads = orjson.loads if orjson is not None else json.loads
+    with open(path, 'rb') as f:
+        for line in f:
+            if line.strip():
+                yield loads(line)
+
+
+LFS_EXE = "LFS.exe"
+SPOTIFY_EXE = "Spotify.exe"
+PROCESS_CHECK_TTL = 1.0  # seconds a process check result is reused
+_process_check_cache = {}
+_known_processes = {}  # exe name -> psutil.Process of the last match
+
+
+def _toolhelp_find_process(exe_name: str):
+    """Scan a Win32 Toolhelp process snapshot for *exe_name*.
+
+    Returns the pid of the first match, 0 if there is none, or None when the
+    snapshot API is not available (non-Windows or failure).
+    """
+    if sys.platform != 'win32':
+        return None
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESSENTRY32W(ctypes.Structure):
+        _fields_ = [('dwSize', wintypes.DWORD),
+                    ('cntUsage', wintypes.DWORD),
+                    ('th32ProcessID', wintypes.DWORD),
+                    ('th32DefaultHeapID', ctypes.c_size_t),
+                    ('th32ModuleID', wintypes.DWORD),
+                    ('cntThreads', wintypes.DWORD),
+                    ('th32ParentProcessID', wintypes.DWORD),
+                    ('pcPriClassBase', ctypes.c_long),
+                    ('dwFlags', wintypes.DWORD),
+                    ('szExeFile', ctypes.c_wchar * 260)]
+
+    TH32CS_SNAPPROCESS = 0x00000002
+    kernel32 = ctypes.windll.kernel32
+    kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+    kernel32.Process32FirstW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+    kernel32.Process32FirstW.restype = wintypes.BOOL
+    kernel32.Process32NextW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+    kernel32.Process32NextW.restype = wintypes.BOOL
+    kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    snapshot = kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+    if not snapshot or snapshot == wintypes.HANDLE(-1).value:
+        return None
+    try:
+        entry = PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+        target = exe_name.lower()
+        found = kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+        while found:
+            if entry.szExeFile.lower() == target:
+                return entry.th32ProcessID
+            found = kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+        return 0
+    finally:
+        kernel32.CloseHandle(snapshot)
+
+
+def _psutil_find_process(target: str) -> int:
+    """Fallback scan: look up process names pid by pid and return the first matching pid (0 if none)."""
+    for pid in psutil.pids():
         try:
-            if proc.name() == "Spotify.exe":
-                return True
+            name = psutil.Process(pid).name()
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            continue
+        if name and name.lower() == target:
+            return pid
+    return 0
 
-        except psutil.AccessDenied:
-            print(
-                "It seems like you do not have sufficient permissions to check for System Apps. Cannot automatically detect if LFS is running!")
+
+def _known_process_alive(exe_name: str) -> bool:
+    """Cheap re-check of the process found by the last scan (psutil guards against pid reuse)."""
+    proc = _known_processes.get(exe_name)
+    if proc is None:
+        return False
+    try:
+        if proc.is_running():
             return True
+    except psutil.Error:
+        pass
+    del _known_processes[exe_name]
+    return False
+
+
+def is_process_running(exe_name: str) -> bool:
+    """Check whether a process called *exe_name* is running (case-insensitive).
+
+    Results are cached for PROCESS_CHECK_TTL seconds so repeated polls
+    (setup wizard, startup loop) share one process scan. Once found, the
+    process is remembered and later checks only test whether it is still alive.
+    """
+    now = time.monotonic()
+    cached = _process_check_cache.get(exe_name)
+    if cached is not None and now - cached[0] < PROCESS_CHECK_TTL:
+        return cached[1]
 
+    running = _known_process_alive(exe_name)
+    if not running:
+        pid = _toolhelp_find_process(exe_name)
+        if pid is None:
+            pid = _psutil_find_process(exe_name.lower())
+        running = pid != 0
+        if running:
+            try:
+                _known_processes[exe_name] = psutil.Process(pid)
+            except psutil.Error:
+                pass
+
+    _process_check_cache[exe_name] = (now, running)
+    return running
+
+
+def is_lfs_running():
+    if is_process_running(LFS_EXE):
+        print("LFS.exe seems to be running. Starting!\n\n")
+        return True
     return False
 
 
+def is_spotify_running():
+    return is_process_running(SPOTIFY_EXE)
+
+
 def calc_polygon_points(own_x, own_y, length, angle):
     # Calculate the coordinates of a point at a certain distance and angle from a given point.
-    return own_x + length * math.cos(math.radians(angle)), own_y + length * math.sin(math.radians(angle))
+    rad = math.radians(angle)
+    return own_x + length * math.cos(rad), own_y + length * math.sin(rad)
+
+
+def calc_polygon_points_batch(own_x, own_y, length, angles):
+    """calc_polygon_points for several angles (degrees) at the same distance."""
+    cos, sin, radians = math.cos, math.sin, math.radians
+    points = []
+    for angle in angles:
+        rad = radians(angle)
+        points.append((own_x + length * cos(rad), own_y + length * sin(rad)))
+    return points
+
+
+# Cosine/sine for every step of LFS' 16-bit angle unit (65536 steps = 360 degrees)
+_COS_TABLE = [math.cos(i * math.tau / 65536) for i in range(65536)]
+_SIN_TABLE = [math.sin(i * math.tau / 65536) for i in range(65536)]
+
+
+def trig_u16(angle: int):
+    """Return (cos, sin) of an angle given in LFS 16-bit units via table lookup."""
+    angle = int(angle) & 0xFFFF
+    return _COS_TABLE[angle], _SIN_TABLE[angle]
 
 
 def point_in_rectangle(point_x, point_y, rect_corners):
@@ -71,26 +229,51 @@ def point_in_rectangle(point_x, point_y, rect_corners):
     Returns:
         bool: True if point is inside rectangle, False otherwise
     """
+    (x1, y1), (x2, y2), (x3, y3), (x4, y4) = rect_corners
+    dx1, dy1 = point_x - x1, point_y - y1
+
+    # Triangle 1: corners 0, 1, 2
+    cp1 = (x2 - x1) * dy1 - (y2 - y1) * dx1
+    cp2 = (x3 - x2) * (point_y - y2) - (y3 - y2) * (point_x - x2)
+    cp3 = (x1 - x3) * (point_y - y3) - (y1 - y3) * (point_x - x3)
+    if (cp1 >= 0 and cp2 >= 0 and cp3 >= 0) or (cp1 <= 0 and cp2 <= 0 and cp3 <= 0):
+        return True
 
-    def cross_product(o, a, b):
-        return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+    # Triangle 2: corners 0, 2, 3
+    cp1 = (x3 - x1) * dy1 - (y3 - y1) * dx1
+    cp2 = (x4 - x3) * (point_y - y3) - (y4 - y3) * (point_x - x3)
+    cp3 = (x1 - x4) * (point_y - y4) - (y1 - y4) * (point_x - x4)
+    return (cp1 >= 0 and cp2 >= 0 and cp3 >= 0) or (cp1 <= 0 and cp2 <= 0 and cp3 <= 0)
 
-    def point_in_triangle(p, a, b, c):
-        # Check if point p is inside triangle abc using cross products
-        cp1 = cross_product(a, b, p)
-        cp2 = cross_product(b, c, p)
-        cp3 = cross_product(c, a, p)
 
-        return (cp1 >= 0 and cp2 >= 0 and cp3 >= 0) or (cp1 <= 0 and cp2 <= 0 and cp3 <= 0)
+def _triangle_edges(a, b, c):
+    """Start point and edge vector of each side of triangle abc."""
+    return ((a[0], a[1], b[0] - a[0], b[1] - a[1]),
+            (b[0], b[1], c[0] - b[0], c[1] - b[1]),
+            (c[0], c[1], a[0] - c[0], a[1] - c[1]))
 
-    # Split rectangle into two triangles and check if point is in either
-    p = (point_x, point_y)
-    x1, y1 = rect_corners[0]
-    x2, y2 = rect_corners[1]
-    x3, y3 = rect_corners[2]
-    x4, y4 = rect_corners[3]
 
-    # Triangle 1: corners 0, 1, 2
-    # Triangle 2: corners 0, 2, 3
-    return (point_in_triangle(p, rect_corners[0], rect_corners[1], rect_corners[2]) or
-            point_in_triangle(p, rect_corners[0], rect_corners[2], rect_corners[3]))
+def points_in_rectangle(points, rect_corners):
+    """
+    Batch variant of point_in_rectangle: the edge vectors are computed once and
+    every (x, y) in *points* is tested against them.
+
+    Returns:
+        list[bool]: one result per point, in order
+    """
+    c0, c1, c2, c3 = rect_corners
+    # Split rectangle into two triangles: corners 0, 1, 2 and corners 0, 2, 3
+    triangles = (_triangle_edges(c0, c1, c2), _triangle_edges(c0, c2, c3))
+
+    results = []
+    for px, py in points:
+        inside = False
+        for (ax, ay, ex, ey), (bx, by, fx, fy), (cx, cy, gx, gy) in triangles:
+            cp1 = ex * (py - ay) - ey * (px - ax)
+            cp2 = fx * (py - by) - fy * (px - bx)
+            cp3 = gx * (py - cy) - gy * (px - cx)
+            if (cp1 >= 0 and cp2 >= 0 and cp3 >= 0) or (cp1 <= 0 and cp2 <= 0 and cp3 <= 0):
+                inside = True
+                break
+        results.append(inside)
+    return results
@@ -1,4 +1,3 @@
-import threading
 from pynput import keyboard, mouse
 from misc.language import LanguageManager
 
@@ -16,17 +15,16 @@ class Keybinder:
         self._mouse_left_first_press = False
 
     def _listen_for_key(self, data):
-        """Start listening for a key press in a separate thread."""
+        """Start listening for a key press; the listeners run in their own threads."""
         setting = data.get('setting')
         if setting is None:
             return
 
         self._current_setting = setting
-        thread = threading.Thread(target=self._start_listening, daemon=True)
-        thread.start()
+        self._start_listening()
 
     def _start_listening(self):
-        """Start the keyboard and mouse listeners."""
+        """Start the keyboard and mouse listeners (non-blocking)."""
         if self._listening:
             return
 
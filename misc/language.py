@@ -1,3 +1,8 @@
+from types import MappingProxyType
+
+_NO_TRANSLATIONS = MappingProxyType({})
+
+
 class LanguageManager:
     """
     A language management class that handles translations for multiple languages.
@@ -6,7 +11,7 @@ class LanguageManager:
 
     def __init__(self):
         """Initialize the language manager with default translations."""
-        self.supported_languages = ['en', 'de', 'it', 'fr', 'tr', 'no', 'dk', 'se']
+        self.supported_languages = ('en', 'de', 'it', 'fr', 'tr', 'no', 'dk', 'se')
         self.default_language = 'en'
 
         # Translation dictionary - organized by English key, then by language code
@@ -913,6 +918,21 @@ class LanguageManager:
             },
         }
 
+        # Per-language lookup tables (language code -> English key -> text), fallbacks already applied
+        self._by_lang = {}
+        self._build_language_tables()
+
+    def _build_language_tables(self):
+        """
+        Flatten the translations into one table per supported language, so a lookup
+        is a single dict access. Missing translations fall back to the default language.
+        """
+        default = self.default_language
+        self._by_lang = {
+            lang: {key: entry.get(lang, entry.get(default, key)) for key, entry in self.translations.items()}
+            for lang in self.supported_languages
+        }
+
     def get(self, english_key, language_code=None):
         """
         Get the translated string for the given English key and language.
@@ -925,35 +945,44 @@ class LanguageManager:
         Returns:
             str: The translated string, or the English version if translation not found
         """
-        # Default to English if no language code provided
-        if language_code is None:
-            language_code = self.default_language
+        # Unknown or missing language code -> default language table
+        table = self._by_lang.get(language_code)
+        if table is None:
+            table = self._by_lang[self.default_language]
+
+        # Return the original key if no translation entry exists
+        return table.get(english_key, english_key)
 
-        # Validate language code
-        if language_code not in self.supported_languages:
-            language_code = self.default_language
 
-        # Check if the English key exists in translations
-        if english_key not in self.translations:
-            # Return the original key if no translation entry exists
-            return english_key
+    def bind(self, language_code=None):
+        """
+        Return a translate function for one language, for code that translates many
+        strings at once (e.g. building a menu).
 
-        # Get the translation for the specific language
-        translation_dict = self.translations[english_key]
+        Args:
+            language_code (str): The target language code; unknown codes use the default language
+
+        Returns:
+            callable: english_key -> translated string (same result as get(english_key, language_code))
+        """
+        table = self._by_lang.get(language_code)
+        if table is None:
+            table = self._by_lang[self.default_language]
+        lookup = table.get
 
-        result = translation_dict.get(language_code, translation_dict.get(self.default_language, english_key))
-        # Return translation if available, otherwise fallback to English
-        return result
+        def translate(english_key):
+            return lookup(english_key, english_key)
 
+        return translate
 
     def get_supported_languages(self):
         """
-        Get list of supported language codes.
+        Get the supported language codes.
 
         Returns:
-            list: List of supported language codes
+            tuple: Supported language codes (immutable, no copy needed)
         """
-        return self.supported_languages.copy()
+        return self.supported_languages
 
     def set_default_language(self, language_code):
         """
@@ -964,6 +993,7 @@ class LanguageManager:
         """
         if language_code in self.supported_languages:
             self.default_language = language_code
+            self._build_language_tables()
 
     def get_all_translations(self, english_key):
         """
@@ -973,9 +1003,10 @@ class LanguageManager:
             english_key (str): The English string to get translations for
 
         Returns:
-            dict: Dictionary with language codes as keys and translations as values
+            Mapping: Read-only view with language codes as keys and translations as values
         """
-        return self.translations.get(english_key, {}).copy()
+        translations = self.translations.get(english_key)
+        return MappingProxyType(translations) if translations is not None else _NO_TRANSLATIONS
 
     def load_translations_from_file(self, filepath):
         """
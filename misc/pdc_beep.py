@@ -1,7 +1,33 @@
+import math
+import queue
 import threading
 import time
 import winsound
-from typing import Dict, Optional
+from array import array
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+
+def _make_tone(frequency: int, duration_ms: int):
+    """Erzeugt einen Sinuston als pygame-Sound im Format des laufenden Mixers (None, wenn nicht möglich)"""
+    mixer_format = pygame.mixer.get_init()
+    if mixer_format is None:
+        return None
+    sample_rate, size, channels = mixer_format
+    if size != -16:
+        return None
+
+    n = int(sample_rate * duration_ms / 1000)
+    fade = min(n // 2, sample_rate // 200)  # 5 ms Ein-/Ausblenden gegen Knacken
+    step = 2 * math.pi * frequency / sample_rate
+    amplitude = 0.5 * 32767
+    samples = array('h')
+    for i in range(n):
+        gain = min(1.0, i / fade, (n - 1 - i) / fade) if fade else 1.0
+        value = int(amplitude * gain * math.sin(step * i))
+        samples.extend((value,) * channels)
+    return pygame.mixer.Sound(buffer=samples.tobytes())
 
 
 class PDCBeepController:
@@ -24,21 +50,44 @@ class PDCBeepController:
         self.event_bus.subscribe('pdc_changed', self._update_pdc_data)
         self.time_last_beep = time.perf_counter()
 
+        # (frequency, duration_ms) -> vorberechneter Ton; der Mixer wird vom AudioPlayer initialisiert
+        self._tones: Dict[Tuple[int, int], pygame.mixer.Sound] = {}
+
+        # Ein dauerhafter Worker spielt die Töne ab, statt pro Beep einen Thread zu starten
+        self._beep_requests = queue.SimpleQueue()
+        self._worker = threading.Thread(target=self._beep_loop, daemon=True)
+        self._worker.start()
+
     def _update_pdc_data(self, pdc_data):
-        self.current_pdc_state_front, self.current_pdc_state_rear = max(list(pdc_data.values())[0:3]), max(list(pdc_data.values())[3:6])
+        # pdc_data: 6-tuple of sensor states, indices 0-2 front, 3-5 rear
+        front_left, front_center, front_right, rear_left, rear_center, rear_right = pdc_data
+        self.current_pdc_state_front = max(front_left, front_center, front_right)
+        self.current_pdc_state_rear = max(rear_left, rear_center, rear_right)
 
 
+    def _beep_loop(self):
+        """Worker thread: plays queued beeps one after another"""
+        while True:
+            frequency, distance = self._beep_requests.get()
+            self._play_beep(frequency, distance)
+
     def _play_beep(self, frequency: int, distance: int):
-        """Worker thread for playing beep patterns"""
+        """Plays one beep of the pattern for the given distance"""
         pattern = self.BEEP_PATTERNS[distance]
 
+        key = (frequency, pattern["beep_duration"])
+
         # Intermittent beep pattern
         try:
-            # Play beep
-            winsound.Beep(frequency, pattern["beep_duration"])
-
-
-
+            tone = self._tones.get(key)
+            if tone is None:
+                tone = _make_tone(*key)  # None, solange kein passender Mixer läuft
+                if tone is not None:
+                    self._tones[key] = tone
+            if tone is not None:
+                tone.play()  # nicht blockierend über den gemeinsamen Mixer
+            else:
+                winsound.Beep(frequency, pattern["beep_duration"])
         except:
             pass
 
@@ -52,6 +101,6 @@ class PDCBeepController:
             pattern = self.BEEP_PATTERNS[max_distance]
             if current_time - self.time_last_beep >= (pattern["beep_duration"] + pattern["pause_duration"]) / 1000.0:
                 self.time_last_beep = time.perf_counter()
-                threading.Thread(target=self._play_beep, args=[frequency, max_distance]).start()
+                self._beep_requests.put((frequency, max_distance))
 
 
@@ -1,6 +1,178 @@
 import math
+import statistics
+from itertools import chain
 from typing import List, Tuple, Dict, Set, Optional
 
+# Zellschlüssel als einzelner int: grid_x * _CELL_ROW + grid_y (eindeutig für |grid_y| < 2**31).
+# Eine Zeile des Grids ist damit ein zusammenhängender Schlüsselbereich, ohne Tupel pro Zugriff.
+_CELL_ROW = 1 << 32
+_CELL_ROW_HALF = _CELL_ROW >> 1  # zum Zurückrechnen: grid_x = (cell_key + _CELL_ROW_HALF) // _CELL_ROW
+
+
+# Geometrie-Primitive als Modulfunktionen: die Hot Paths rufen sie direkt auf,
+# ohne Methoden-Lookup über self und ohne Tupel für Punkte bzw. Linien zu bauen
+
+def _point_in_polygon(x: float, y: float, polygon: List[Tuple[float, float]]) -> bool:
+    """Ray Casting für einen Punkt (x, y)."""
+    inside = False
+
+    # Gerade/Ungerade-Regel: eine Kante zählt, wenn sie die Höhe y kreuzt (genau ein Endpunkt
+    # unterhalb) und der Schnittpunkt rechts vom Punkt liegt. Horizontale Kanten fallen durch
+    # den ersten Vergleich heraus, die Division ist daher immer sicher.
+    p1x, p1y = polygon[-1]
+    for p2x, p2y in polygon:
+        if (p1y < y) != (p2y < y) and x <= (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x:
+            inside = not inside
+        p1x, p1y = p2x, p2y
+
+    return inside
+
+
+def _any_point_in_polygon(points: List[Tuple[float, float]], polygon: List[Tuple[float, float]]) -> bool:
+    """Wie _point_in_polygon für mehrere Punkte, in einem Funktionsrahmen ohne Aufruf pro Punkt."""
+    last = polygon[-1]
+    for x, y in points:
+        inside = False
+        p1x, p1y = last
+        for p2x, p2y in polygon:
+            if (p1y < y) != (p2y < y) and x <= (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x:
+                inside = not inside
+            p1x, p1y = p2x, p2y
+        if inside:
+            return True
+
+    return False
+
+
+def _segments_intersect(x1: float, y1: float, x2: float, y2: float,
+                        x3: float, y3: float, x4: float, y4: float) -> bool:
+    """Prüft ob sich die Strecken (x1,y1)-(x2,y2) und (x3,y3)-(x4,y4) schneiden."""
+    dx12 = x1 - x2
+    dy12 = y1 - y2
+    dx34 = x3 - x4
+    dy34 = y3 - y4
+    denom = dx12 * dy34 - dy12 * dx34
+    if abs(denom) < 1e-10:  # Parallel lines
+        return False
+
+    dx13 = x1 - x3
+    dy13 = y1 - y3
+    t_num = dx13 * dy34 - dy13 * dx34
+    u_num = dy12 * dx13 - dx12 * dy13
+
+    # t = t_num / denom und u = u_num / denom müssen in [0, 1] liegen; Vergleich ohne Division
+    if denom < 0:
+        denom, t_num, u_num = -denom, -t_num, -u_num
+    return 0 <= t_num <= denom and 0 <= u_num <= denom
+
+
+def _edge_list(polygon: List[Tuple[float, float]]) -> List[Tuple[float, float, float, float]]:
+    """Kanten c -> d eines Polygons als (cx, cy, cx - dx, cy - dy), beginnend mit der schließenden Kante."""
+    edges = []
+    cx, cy = polygon[-1]
+    for dx, dy in polygon:
+        edges.append((cx, cy, cx - dx, cy - dy))
+        cx, cy = dx, dy
+    return edges
+
+
+def _is_convex(polygon: List[Tuple[float, float]]) -> bool:
+    """
+    True für Dreiecke und streng konvexe Vierecke (alle Kanten knicken in dieselbe Richtung).
+    Größere Polygone gelten als nicht konvex, dort schließt der Vorzeichentest Sterne nicht aus.
+    """
+    n = len(polygon)
+    if n == 3:
+        return True
+    if n != 4:
+        return False
+    (x0, y0), (x1, y1), (x2, y2), (x3, y3) = polygon
+    c0 = (x1 - x0) * (y2 - y1) - (y1 - y0) * (x2 - x1)
+    c1 = (x2 - x1) * (y3 - y2) - (y2 - y1) * (x3 - x2)
+    c2 = (x3 - x2) * (y0 - y3) - (y3 - y2) * (x0 - x3)
+    c3 = (x0 - x3) * (y1 - y0) - (y0 - y3) * (x1 - x0)
+    return (c0 > 0 and c1 > 0 and c2 > 0 and c3 > 0) or (c0 < 0 and c1 < 0 and c2 < 0 and c3 < 0)
+
+
+def _separating_edge(poly_a: List[Tuple[float, float]], poly_b: List[Tuple[float, float]]) -> bool:
+    """True wenn eine Kantennormale von poly_a die beiden (konvexen) Polygone trennt."""
+    ax, ay = poly_a[-1]
+    for bx, by in poly_a:
+        # Normale der Kante a -> b, beide Polygone darauf projizieren
+        nx = ay - by
+        ny = bx - ax
+        min_a = max_a = ax * nx + ay * ny
+        for px, py in poly_a:
+            d = px * nx + py * ny
+            if d < min_a:
+                min_a = d
+            elif d > max_a:
+                max_a = d
+        px, py = poly_b[0]
+        min_b = max_b = px * nx + py * ny
+        for px, py in poly_b:
+            d = px * nx + py * ny
+            if d < min_b:
+                min_b = d
+            elif d > max_b:
+                max_b = d
+        # Berührende Intervalle zählen als Überschneidung, wie beim Kantentest
+        if max_b < min_a or max_a < min_b:
+            return True
+        ax, ay = bx, by
+
+    return False
+
+
+def _polygons_intersect(poly1: List[Tuple[float, float]], poly2: List[Tuple[float, float]],
+                        edges2: Optional[List[Tuple[float, float, float, float]]] = None) -> bool:
+    """
+    Polygon-Polygon-Test in einem Funktionsrahmen, der Kantentest ist direkt eingebettet.
+    edges2 kann die bereits vorbereiteten Kanten von poly2 (siehe _edge_list) enthalten.
+    """
+    # Konvexe Drei- und Vierecke (Sensoren, Fahrzeuge, Layout-Objekte): Separating Axis Theorem,
+    # nur Skalarprodukte statt Punkt-in-Polygon- und Kantenschnitt-Tests
+    if _is_convex(poly1) and _is_convex(poly2):
+        return not (_separating_edge(poly1, poly2) or _separating_edge(poly2, poly1))
+
+    # Test 1: Prüfe ob ein Polygon Punkte des anderen enthält
+    if _any_point_in_polygon(poly1, poly2) or _any_point_in_polygon(poly2, poly1):
+        return True
+
+    # Test 2: Prüfe ob sich Kanten schneiden; Kanten von poly2 nur einmal aufbereiten
+    if edges2 is None:
+        edges2 = _edge_list(poly2)
+
+    # Kante a -> b aus poly1 gegen Kante c -> d aus poly2, gleiche Formel wie _segments_intersect
+    ax, ay = poly1[-1]
+    for bx, by in poly1:
+        dx_ab = ax - bx
+        dy_ab = ay - by
+        for cx, cy, dx_cd, dy_cd in edges2:
+            denom = dx_ab * dy_cd - dy_ab * dx_cd
+            if abs(denom) < 1e-10:  # Parallel lines
+                continue
+            dx_ac = ax - cx
+            dy_ac = ay - cy
+            t_num = dx_ac * dy_cd - dy_ac * dx_cd
+            u_num = dy_ab * dx_ac - dx_ab * dy_ac
+            if denom < 0:
+                denom, t_num, u_num = -denom, -t_num, -u_num
+            if 0 <= t_num <= denom and 0 <= u_num <= denom:
+                return True
+        ax, ay = bx, by
+
+    return False
+
+
+def _is_axis_aligned_rectangle(points: List[Tuple[float, float]]) -> bool:
+    """True wenn die Punkte ein achsenparalleles Rechteck bilden, dessen AABB also exakt ist."""
+    if len(points) != 4:
+        return False
+    (x0, y0), (x1, y1), (x2, y2), (x3, y3) = points
+    return ((x0 == x1 and y1 == y2 and x2 == x3 and y3 == y0) or
+            (y0 == y1 and x1 == x2 and y2 == y3 and x3 == x0)) and x0 != x2 and y0 != y2
+
 
 class SpatialHashGrid:
     """
@@ -16,7 +188,20 @@ class SpatialHashGrid:
             cell_size: Größe einer Grid-Zelle in Metern (empfohlen: 5-15m)
         """
         self.cell_size = cell_size
-        self.grid: Dict[Tuple[int, int], List[Dict]] = {}
+        # Grid-Zellen enthalten nur Objekt-IDs, die Geometrie liegt spaltenweise (SoA) in eigenen Dicts.
+        # Statische und dynamische Objekte liegen in getrennten Grids: Fahrzeuge werden jeden Tick
+        # neu eingetragen, ohne die Zelllisten der (vielen) Layout-Objekte anzufassen
+        self.static_grid: Dict[int, List[int]] = {}
+        self.dynamic_grid: Dict[int, List[int]] = {}
+        self.points: Dict[int, List[Tuple[float, float]]] = {}
+        self.bboxes: Dict[int, Tuple[float, float, float, float]] = {}
+        # Vorbereitete Kanten je Objekt (siehe _edge_list), spart den Aufbau bei jeder Polygon-Abfrage
+        self.edges: Dict[int, List[Tuple[float, float, float, float]]] = {}
+        # Belegte Zellbereiche (grid_min_x, grid_min_y, grid_max_x, grid_max_y) je Objekt, für remove_object
+        self.cell_ranges: Dict[int, Tuple[int, int, int, int]] = {}
+        # Objekte, deren AABB exakt ist (achsenparallele Rechtecke): Rechteck-Tests reduzieren sich auf AABB-Vergleiche
+        self.axis_aligned: Set[int] = set()
+        self.metadata: Dict[int, Dict] = {}
         self.static_objects: Dict[int, List[Tuple[float, float]]] = {}
         self.dynamic_objects: Dict[int, List[Tuple[float, float]]] = {}
 
@@ -38,10 +223,17 @@ class SpatialHashGrid:
         if not points or len(points) < 3:
             raise ValueError("Mindestens 3 Punkte erforderlich")
 
-        min_x = min(point[0] for point in points)
-        max_x = max(point[0] for point in points)
-        min_y = min(point[1] for point in points)
-        max_y = max(point[1] for point in points)
+        # Ein einziger Durchlauf statt vier Generator-Ausdrücken
+        min_x, min_y = max_x, max_y = points[0]
+        for x, y in points:
+            if x < min_x:
+                min_x = x
+            elif x > max_x:
+                max_x = x
+            if y < min_y:
+                min_y = y
+            elif y > max_y:
+                max_y = y
 
         return (min_x, min_y, max_x, max_y)
 
@@ -70,23 +262,32 @@ class SpatialHashGrid:
         Returns:
             True wenn der Punkt im Polygon liegt
         """
-        x, y = point
-        n = len(polygon)
-        inside = False
+        return _point_in_polygon(point[0], point[1], polygon)
 
-        p1x, p1y = polygon[0]
-        for i in range(1, n + 1):
-            p2x, p2y = polygon[i % n]
-            if y > min(p1y, p2y):
-                if y <= max(p1y, p2y):
-                    if x <= max(p1x, p2x):
-                        if p1y != p2y:
-                            xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
-                        if p1x == p2x or x <= xinters:
-                            inside = not inside
-            p1x, p1y = p2x, p2y
+    def points_in_polygon_batch(self, points: List[Tuple[float, float]],
+                                polygon: List[Tuple[float, float]]) -> List[bool]:
+        """
+        Prüft viele Punkte gegen dasselbe Polygon in einem Aufruf (gleiches Ray Casting wie point_in_polygon).
 
-        return inside
+        Args:
+            points: Die zu prüfenden Punkte [(x, y), ...]
+            polygon: Liste der Polygon-Eckpunkte
+
+        Returns:
+            Pro Punkt True wenn er im Polygon liegt, gleiche Reihenfolge wie points
+        """
+        result = []
+        last = polygon[-1]
+        for x, y in points:
+            inside = False
+            p1x, p1y = last
+            for p2x, p2y in polygon:
+                if (p1y < y) != (p2y < y) and x <= (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x:
+                    inside = not inside
+                p1x, p1y = p2x, p2y
+            result.append(inside)
+
+        return result
 
     def line_intersects_line(self, line1: Tuple[Tuple[float, float], Tuple[float, float]],
                              line2: Tuple[Tuple[float, float], Tuple[float, float]]) -> bool:
@@ -102,15 +303,7 @@ class SpatialHashGrid:
         """
         (x1, y1), (x2, y2) = line1
         (x3, y3), (x4, y4) = line2
-
-        denom = (x1 - x2) * (y3 - y4) - (y1 - y2) * (x3 - x4)
-        if abs(denom) < 1e-10:  # Parallel lines
-            return False
-
-        t = ((x1 - x3) * (y3 - y4) - (y1 - y3) * (x3 - x4)) / denom
-        u = -((x1 - x2) * (y1 - y3) - (y1 - y2) * (x1 - x3)) / denom
-
-        return 0 <= t <= 1 and 0 <= u <= 1
+        return _segments_intersect(x1, y1, x2, y2, x3, y3, x4, y4)
 
     def polygons_intersect(self, poly1: List[Tuple[float, float]],
                            poly2: List[Tuple[float, float]]) -> bool:
@@ -124,26 +317,7 @@ class SpatialHashGrid:
         Returns:
             True wenn sich die Polygone überschneiden
         """
-        # Test 1: Prüfe ob ein Polygon Punkte des anderen enthält
-        for point in poly1:
-            if self.point_in_polygon(point, poly2):
-                return True
-
-        for point in poly2:
-            if self.point_in_polygon(point, poly1):
-                return True
-
-        # Test 2: Prüfe ob sich Kanten schneiden
-        n1, n2 = len(poly1), len(poly2)
-
-        for i in range(n1):
-            line1 = (poly1[i], poly1[(i + 1) % n1])
-            for j in range(n2):
-                line2 = (poly2[j], poly2[(j + 1) % n2])
-                if self.line_intersects_line(line1, line2):
-                    return True
-
-        return False
+        return _polygons_intersect(poly1, poly2)
 
     def polygon_intersects_circle(self, polygon: List[Tuple[float, float]],
                                   center: Tuple[float, float], radius: float) -> bool:
@@ -161,29 +335,32 @@ class SpatialHashGrid:
         cx, cy = center
 
         # Test 1: Ist der Kreismittelpunkt im Polygon?
-        if self.point_in_polygon(center, polygon):
+        if _point_in_polygon(cx, cy, polygon):
             return True
 
-        # Test 2: Prüfe Distanz zu allen Kanten
-        n = len(polygon)
-        for i in range(n):
-            x1, y1 = polygon[i]
-            x2, y2 = polygon[(i + 1) % n]
+        # Test 2: Prüfe Distanz zu allen Kanten (alles quadriert, keine Wurzel)
+        radius_sq = radius * radius
+        # Kanten paarweise ablaufen, beginnend mit der schließenden Kante (letzter -> erster Punkt)
+        x1, y1 = polygon[-1]
+        for x2, y2 in polygon:
+            edge_x = x2 - x1
+            edge_y = y2 - y1
 
             # Distanz vom Punkt zur Linie berechnen
-            line_length_sq = (x2 - x1) ** 2 + (y2 - y1) ** 2
+            line_length_sq = edge_x * edge_x + edge_y * edge_y
             if line_length_sq == 0:
                 # Punkt zu Punkt Distanz
-                dist_sq = (cx - x1) ** 2 + (cy - y1) ** 2
+                dist_x = cx - x1
+                dist_y = cy - y1
             else:
                 # Projektion auf die Linie
-                t = max(0.0, min(1.0, ((cx - x1) * (x2 - x1) + (cy - y1) * (y2 - y1)) / line_length_sq))
-                projection_x = x1 + t * (x2 - x1)
-                projection_y = y1 + t * (y2 - y1)
-                dist_sq = (cx - projection_x) ** 2 + (cy - projection_y) ** 2
+                t = max(0.0, min(1.0, ((cx - x1) * edge_x + (cy - y1) * edge_y) / line_length_sq))
+                dist_x = cx - (x1 + t * edge_x)
+                dist_y = cy - (y1 + t * edge_y)
 
-            if dist_sq <= radius ** 2:
+            if dist_x * dist_x + dist_y * dist_y <= radius_sq:
                 return True
+            x1, y1 = x2, y2
 
         return False
 
@@ -200,9 +377,31 @@ class SpatialHashGrid:
             True wenn sich Polygon und Rechteck überschneiden
         """
         min_x, min_y, max_x, max_y = rect_bounds
-        rectangle = [(min_x, min_y), (max_x, min_y), (max_x, max_y), (min_x, max_y)]
 
-        return self.polygons_intersect(polygon, rectangle)
+        # Test 1: Eckpunkt des Polygons im Rechteck, vier Vergleiche statt Ray Casting
+        for x, y in polygon:
+            if min_x <= x <= max_x and min_y <= y <= max_y:
+                return True
+
+        # Test 2: Ecke des Rechtecks im Polygon
+        rectangle = ((min_x, min_y), (max_x, min_y), (max_x, max_y), (min_x, max_y))
+        if _any_point_in_polygon(rectangle, polygon):
+            return True
+
+        # Test 3: Polygonkante schneidet Rechteckkante; Kanten komplett auf einer Seite
+        # des Rechtecks können nicht schneiden und werden ohne Schnittrechnung übersprungen
+        x1, y1 = polygon[-1]
+        for x2, y2 in polygon:
+            if not ((x1 < min_x and x2 < min_x) or (x1 > max_x and x2 > max_x) or
+                    (y1 < min_y and y2 < min_y) or (y1 > max_y and y2 > max_y)):
+                x3, y3 = rectangle[-1]
+                for x4, y4 in rectangle:
+                    if _segments_intersect(x1, y1, x2, y2, x3, y3, x4, y4):
+                        return True
+                    x3, y3 = x4, y4
+            x1, y1 = x2, y2
+
+        return False
 
     def insert_object(self, object_id: int, points: List[Tuple[float, float]],
                       is_static: bool = True, metadata: Optional[Dict] = None):
@@ -210,82 +409,145 @@ class SpatialHashGrid:
         Fügt ein Objekt ins Grid ein.
 
         Args:
-            object_id: Eindeutige ID des Objekts
+            object_id: Eindeutige ID des Objekts (ein vorhandenes Objekt mit gleicher ID wird ersetzt)
             points: 4 Koordinaten des Objekts
             is_static: True für statische Objekte (Straßenobjekte), False für Fahrzeuge
             metadata: Zusätzliche Objektdaten
         """
         if len(points) < 3:
             raise ValueError("Mindestens 3 Punkte erforderlich")
+        if object_id in self.points:
+            self.remove_object(object_id)
+        grid = self.static_grid if is_static else self.dynamic_grid
 
-        # Objekt-Info erstellen - jetzt mit beiden Geometrien
-        obj_info = {
-            'id': object_id,
-            'points': points.copy(),  # Tatsächliche Geometrie für präzise Kollision
-            'bbox': self.calculate_bbox(points),  # AABB nur für Grid-Optimierung
-            'is_static': is_static,
-            'metadata': metadata or {}
-        }
+        points = points.copy()
+        self.points[object_id] = points  # Tatsächliche Geometrie für präzise Kollision
+        bbox = self.calculate_bbox(points)  # AABB nur für Grid-Optimierung
+        self.bboxes[object_id] = bbox
+        self.edges[object_id] = _edge_list(points)
+        if metadata:
+            self.metadata[object_id] = metadata
 
         # Grid-Bereiche berechnen (basierend auf AABB)
-        grid_min_x, grid_min_y, grid_max_x, grid_max_y = self.get_grid_bounds(points)
+        grid_min_x, grid_min_y = self.world_to_grid(bbox[0], bbox[1])
+        grid_max_x, grid_max_y = self.world_to_grid(bbox[2], bbox[3])
+        self.cell_ranges[object_id] = (grid_min_x, grid_min_y, grid_max_x, grid_max_y)
+        if _is_axis_aligned_rectangle(points):
+            self.axis_aligned.add(object_id)
 
         # Objekt in alle überschneidenden Grid-Zellen einfügen
-        for grid_x in range(grid_min_x, grid_max_x + 1):
-            for grid_y in range(grid_min_y, grid_max_y + 1):
-                cell_key = (grid_x, grid_y)
-
-                if cell_key not in self.grid:
-                    self.grid[cell_key] = []
+        for row in range(grid_min_x * _CELL_ROW, grid_max_x * _CELL_ROW + 1, _CELL_ROW):
+            for cell_key in range(row + grid_min_y, row + grid_max_y + 1):
+                if cell_key not in grid:
+                    grid[cell_key] = []
 
-                self.grid[cell_key].append(obj_info)
+                grid[cell_key].append(object_id)
 
         # Objekt-Tracking
         if is_static:
-            self.static_objects[object_id] = points.copy()
+            self.static_objects[object_id] = points
         else:
-            self.dynamic_objects[object_id] = points.copy()
+            self.dynamic_objects[object_id] = points
 
-    def remove_object(self, object_id: int, points: Optional[List[Tuple[float, float]]] = None):
+    def insert_objects_bulk(self, object_ids: List[int], points_list: List[List[Tuple[float, float]]],
+                            is_static: bool = True):
         """
-        Entfernt ein Objekt aus dem Grid.
+        Fügt viele Objekte auf einmal ins Grid ein (z.B. alle Layout-Objekte eines AXM-Pakets).
+        Die Zellzuordnung wird zuerst gesammelt und dann pro Zelle in einem Schritt übernommen.
 
         Args:
-            object_id: ID des zu entfernenden Objekts
-            points: Koordinaten (wenn bekannt, sonst wird gesucht)
-        """
-        # Koordinaten finden wenn nicht gegeben
-        if points is None:
-            if object_id in self.static_objects:
-                points = self.static_objects[object_id]
-            elif object_id in self.dynamic_objects:
-                points = self.dynamic_objects[object_id]
+            object_ids: Eindeutige IDs der Objekte (vorhandene Objekte mit gleicher ID werden ersetzt)
+            points_list: Koordinaten der Objekte, gleiche Reihenfolge wie object_ids
+            is_static: True für statische Objekte (Straßenobjekte), False für Fahrzeuge
+        """
+        cell_size = self.cell_size
+        grid = self.static_grid if is_static else self.dynamic_grid
+        tracking = self.static_objects if is_static else self.dynamic_objects
+        new_cells: Dict[int, List[int]] = {}
+
+        # Doppelte IDs im Paket: das letzte Objekt gewinnt, wie bei einzelnem insert_object
+        for object_id, points in dict(zip(object_ids, points_list)).items():
+            if len(points) < 3:
+                raise ValueError("Mindestens 3 Punkte erforderlich")
+            if object_id in self.points:
+                self.remove_object(object_id)
+            points = list(points)
+            bbox = self.calculate_bbox(points)
+            self.points[object_id] = points
+            self.bboxes[object_id] = bbox
+            self.edges[object_id] = _edge_list(points)
+            tracking[object_id] = points
+
+            min_x, min_y, max_x, max_y = bbox
+            grid_min_x, grid_min_y = int(min_x // cell_size), int(min_y // cell_size)
+            grid_max_x, grid_max_y = int(max_x // cell_size), int(max_y // cell_size)
+            self.cell_ranges[object_id] = (grid_min_x, grid_min_y, grid_max_x, grid_max_y)
+            if _is_axis_aligned_rectangle(points):
+                self.axis_aligned.add(object_id)
+            for row in range(grid_min_x * _CELL_ROW, grid_max_x * _CELL_ROW + 1, _CELL_ROW):
+                for cell_key in range(row + grid_min_y, row + grid_max_y + 1):
+                    if cell_key in new_cells:
+                        new_cells[cell_key].append(object_id)
+                    else:
+                        new_cells[cell_key] = [object_id]
+
+        for cell_key, ids in new_cells.items():
+            if cell_key in grid:
+                grid[cell_key].extend(ids)
             else:
-                # Objekt nicht gefunden, nichts zu tun
-                return
+                grid[cell_key] = ids
 
-        # Grid-Bereiche berechnen
-        grid_min_x, grid_min_y, grid_max_x, grid_max_y = self.get_grid_bounds(points)
-
-        # Objekt aus allen Grid-Zellen entfernen
-        for grid_x in range(grid_min_x, grid_max_x + 1):
-            for grid_y in range(grid_min_y, grid_max_y + 1):
-                cell_key = (grid_x, grid_y)
-
-                if cell_key in self.grid:
-                    self.grid[cell_key] = [obj for obj in self.grid[cell_key]
-                                           if obj['id'] != object_id]
+    def remove_object(self, object_id: int, points: Optional[List[Tuple[float, float]]] = None):
+        """
+        Entfernt ein Objekt aus dem Grid.
 
-                    # Leere Zellen entfernen
-                    if not self.grid[cell_key]:
-                        del self.grid[cell_key]
+        Args:
+            object_id: ID des zu entfernenden Objekts
+            points: Nicht mehr nötig, die belegten Zellen werden beim Einfügen gespeichert
+        """
+        # Belegte Zellen aus dem Cache, keine erneute AABB-Berechnung
+        cell_range = self.cell_ranges.pop(object_id, None)
+        if cell_range is None:
+            # Objekt nicht gefunden, nichts zu tun
+            return
+        grid_min_x, grid_min_y, grid_max_x, grid_max_y = cell_range
+        grid = self.dynamic_grid if object_id in self.dynamic_objects else self.static_grid
+
+        # Objekt aus allen Grid-Zellen entfernen. Die Reihenfolge in einer Zelle ist egal, daher wird
+        # der Eintrag mit dem letzten getauscht und abgeschnitten statt die Liste neu aufzubauen
+        for row in range(grid_min_x * _CELL_ROW, grid_max_x * _CELL_ROW + 1, _CELL_ROW):
+            for cell_key in range(row + grid_min_y, row + grid_max_y + 1):
+                cell = grid.get(cell_key)
+                if cell is None:
+                    continue
+                try:
+                    index = cell.index(object_id)
+                except ValueError:
+                    continue
+                last = cell.pop()
+                if index < len(cell):
+                    cell[index] = last
+
+                # Leere Zellen entfernen
+                if not cell:
+                    del grid[cell_key]
 
         # Aus Tracking entfernen
+        self._forget(object_id)
         if object_id in self.static_objects:
             del self.static_objects[object_id]
         if object_id in self.dynamic_objects:
             del self.dynamic_objects[object_id]
 
+    def _forget(self, object_id: int):
+        """Entfernt die Geometrie-Spalten eines Objekts (ohne Grid-Zellen und Tracking)."""
+        self.points.pop(object_id, None)
+        self.bboxes.pop(object_id, None)
+        self.edges.pop(object_id, None)
+        self.cell_ranges.pop(object_id, None)
+        self.axis_aligned.discard(object_id)
+        self.metadata.pop(object_id, None)
+
     def update_dynamic_object(self, object_id: int, new_points: List[Tuple[float, float]],
                               metadata: Optional[Dict] = None):
         """
@@ -296,46 +558,167 @@ class SpatialHashGrid:
             new_points: Neue Koordinaten
             metadata: Aktualisierte Metadaten
         """
-        # Altes Objekt entfernen
         if object_id in self.dynamic_objects:
-            old_points = self.dynamic_objects[object_id]
-            self.remove_object(object_id, old_points)
+            new_points = new_points.copy()
+            bbox = self.calculate_bbox(new_points)
+            grid_min_x, grid_min_y = self.world_to_grid(bbox[0], bbox[1])
+            grid_max_x, grid_max_y = self.world_to_grid(bbox[2], bbox[3])
+
+            # Gleiche Zellen: nur Geometrie austauschen, Grid-Listen bleiben unverändert
+            if self.cell_ranges[object_id] == (grid_min_x, grid_min_y, grid_max_x, grid_max_y):
+                self.points[object_id] = new_points
+                self.bboxes[object_id] = bbox
+                self.edges[object_id] = _edge_list(new_points)
+                if _is_axis_aligned_rectangle(new_points):
+                    self.axis_aligned.add(object_id)
+                else:
+                    self.axis_aligned.discard(object_id)
+                if metadata:
+                    self.metadata[object_id] = metadata
+                else:
+                    self.metadata.pop(object_id, None)
+                self.dynamic_objects[object_id] = new_points
+                return
+
+            # Altes Objekt entfernen
+            self.remove_object(object_id)
 
         # Neues Objekt einfügen
         self.insert_object(object_id, new_points, is_static=False, metadata=metadata)
 
-    def query_area(self, center_x: float, center_y: float, radius: float) -> List[Dict]:
-        """
-        Findet alle Objekte in einem kreisförmigen Bereich.
-        Verwendet präzise Polygon-Kreis-Kollisionserkennung.
+    def get_object(self, object_id: int) -> Dict:
+        """Baut die Objekt-Info (id, points, bbox, is_static, metadata) für eine ID zusammen."""
+        return {
+            'id': object_id,
+            'points': self.points[object_id],
+            'bbox': self.bboxes[object_id],
+            'is_static': object_id in self.static_objects,
+            'metadata': self.metadata.get(object_id, {})
+        }
+
+    def _candidate_ids(self, grid_min_x: int, grid_min_y: int, grid_max_x: int, grid_max_y: int,
+                       polygon: Optional[List[Tuple[float, float]]] = None) -> Dict[int, None]:
+        """
+        Sammelt die IDs aller Objekte in einem Zellbereich.
+        Jede ID kommt genau einmal vor (Reihenfolge des ersten Auftretens), die Deduplizierung
+        übernimmt dict.fromkeys in einem Schritt statt einer Set-Abfrage pro Objekt und Zelle.
+        Mit polygon werden nur die Zellen des Bereichs gelesen, die das Polygon tatsächlich überdeckt.
+        """
+        static_grid = self.static_grid
+        dynamic_grid = self.dynamic_grid
+
+        # Großer Bereich mit wenigen belegten Zellen: die belegten Zellen durchgehen und filtern
+        # ist dann günstiger als jede Zelle des Bereichs einzeln nachzuschlagen
+        area_cells = (grid_max_x - grid_min_x + 1) * (grid_max_y - grid_min_y + 1)
+        if area_cells > 4 * (len(static_grid) + len(dynamic_grid)):
+            cells = []
+            for grid in (static_grid, dynamic_grid):
+                for cell_key, cell in grid.items():
+                    grid_x = (cell_key + _CELL_ROW_HALF) // _CELL_ROW
+                    grid_y = cell_key - grid_x * _CELL_ROW
+                    if grid_min_x <= grid_x <= grid_max_x and grid_min_y <= grid_y <= grid_max_y:
+                        cells.append(cell)
+            return dict.fromkeys(chain.from_iterable(cells))
+
+        if polygon is not None:
+            cell_keys = self._polygon_cell_keys(polygon, grid_min_x, grid_max_x)
+        else:
+            cell_keys = [cell_key
+                         for row in range(grid_min_x * _CELL_ROW, grid_max_x * _CELL_ROW + 1, _CELL_ROW)
+                         for cell_key in range(row + grid_min_y, row + grid_max_y + 1)]
+        cells = [static_grid.get(cell_key, ()) for cell_key in cell_keys]
+        if dynamic_grid:
+            cells += [dynamic_grid.get(cell_key, ()) for cell_key in cell_keys]
+        return dict.fromkeys(chain.from_iterable(cells))
+
+    def _polygon_cell_keys(self, polygon: List[Tuple[float, float]], grid_min_x: int, grid_max_x: int) -> List[int]:
+        """
+        Zellschlüssel der Zellen, die ein Polygon überdeckt (Scanline je Grid-Spalte).
+        Pro Spalte wird die y-Ausdehnung des Polygons innerhalb des Spaltenstreifens bestimmt: aus den
+        Eckpunkten im Streifen und den Schnittpunkten der Kanten mit den Streifengrenzen.
+        Schmale, schräge Polygone belegen so deutlich weniger Zellen als ihre AABB.
+        """
+        cell_size = self.cell_size
+        cell_keys = []
+        for grid_x in range(grid_min_x, grid_max_x + 1):
+            band_min = grid_x * cell_size
+            band_max = band_min + cell_size
+            y_min = math.inf
+            y_max = -math.inf
+            x1, y1 = polygon[-1]
+            for x2, y2 in polygon:
+                if band_min <= x2 <= band_max:
+                    if y2 < y_min:
+                        y_min = y2
+                    if y2 > y_max:
+                        y_max = y2
+                for border in (band_min, band_max):
+                    if (x1 < border) != (x2 < border):
+                        y = y1 + (border - x1) * (y2 - y1) / (x2 - x1)
+                        if y < y_min:
+                            y_min = y
+                        if y > y_max:
+                            y_max = y
+                x1, y1 = x2, y2
+            if y_min <= y_max:
+                row = grid_x * _CELL_ROW
+                cell_keys.extend(range(row + int(y_min // cell_size), row + int(y_max // cell_size) + 1))
+
+        return cell_keys
+
+    def query_area_ids(self, center_x: float, center_y: float, radius: float,
+                       out: Optional[List[int]] = None) -> List[int]:
+        """
+        Findet die IDs aller Objekte in einem kreisförmigen Bereich.
+        Die Geometrie kann anschließend direkt über self.points[id] gelesen werden.
 
         Args:
             center_x, center_y: Mittelpunkt der Suche
             radius: Suchradius in Metern
+            out: Optionale Ergebnisliste, die geleert und wiederverwendet wird (z.B. einmal pro Tick)
 
         Returns:
-            Liste der gefundenen Objekte
+            Liste der gefundenen Objekt-IDs (out, falls angegeben)
         """
         # Grid-Bereich um das Zentrum (AABB für Performance)
         grid_min_x, grid_min_y = self.world_to_grid(center_x - radius, center_y - radius)
         grid_max_x, grid_max_y = self.world_to_grid(center_x + radius, center_y + radius)
 
-        nearby_objects = []
-        processed_ids: Set[int] = set()
+        if out is None:
+            nearby_ids = []
+        else:
+            nearby_ids = out
+            nearby_ids.clear()
+        bboxes = self.bboxes
+        center = (center_x, center_y)
+        radius_sq = radius * radius
+
+        for obj_id in self._candidate_ids(grid_min_x, grid_min_y, grid_max_x, grid_max_y):
+            # Grobfilter: Abstand Kreismittelpunkt zur gecachten AABB
+            min_x, min_y, max_x, max_y = bboxes[obj_id]
+            dx = max(min_x - center_x, 0.0, center_x - max_x)
+            dy = max(min_y - center_y, 0.0, center_y - max_y)
+            if dx * dx + dy * dy > radius_sq:
+                continue
+            # Präzise Polygon-Kreis-Kollisionserkennung
+            if self.polygon_intersects_circle(self.points[obj_id], center, radius):
+                nearby_ids.append(obj_id)
+
+        return nearby_ids
 
-        for grid_x in range(grid_min_x, grid_max_x + 1):
-            for grid_y in range(grid_min_y, grid_max_y + 1):
-                cell_key = (grid_x, grid_y)
+    def query_area(self, center_x: float, center_y: float, radius: float) -> List[Dict]:
+        """
+        Findet alle Objekte in einem kreisförmigen Bereich.
+        Verwendet präzise Polygon-Kreis-Kollisionserkennung.
 
-                if cell_key in self.grid:
-                    for obj in self.grid[cell_key]:
-                        if obj['id'] not in processed_ids:
-                            # Präzise Polygon-Kreis-Kollisionserkennung
-                            if self.polygon_intersects_circle(obj['points'], (center_x, center_y), radius):
-                                nearby_objects.append(obj)
-                                processed_ids.add(obj['id'])
+        Args:
+            center_x, center_y: Mittelpunkt der Suche
+            radius: Suchradius in Metern
 
-        return nearby_objects
+        Returns:
+            Liste der gefundenen Objekte
+        """
+        return [self.get_object(obj_id) for obj_id in self.query_area_ids(center_x, center_y, radius)]
 
     def query_rectangle(self, min_x: float, min_y: float,
                         max_x: float, max_y: float) -> List[Dict]:
@@ -354,19 +737,19 @@ class SpatialHashGrid:
         grid_max_x, grid_max_y = self.world_to_grid(max_x, max_y)
 
         nearby_objects = []
-        processed_ids: Set[int] = set()
-
-        for grid_x in range(grid_min_x, grid_max_x + 1):
-            for grid_y in range(grid_min_y, grid_max_y + 1):
-                cell_key = (grid_x, grid_y)
-
-                if cell_key in self.grid:
-                    for obj in self.grid[cell_key]:
-                        if obj['id'] not in processed_ids:
-                            # Präzise Polygon-Rechteck-Kollisionserkennung
-                            if self.polygon_intersects_rectangle(obj['points'], (min_x, min_y, max_x, max_y)):
-                                nearby_objects.append(obj)
-                                processed_ids.add(obj['id'])
+        rect_bounds = (min_x, min_y, max_x, max_y)
+        bboxes = self.bboxes
+        axis_aligned = self.axis_aligned
+
+        for obj_id in self._candidate_ids(grid_min_x, grid_min_y, grid_max_x, grid_max_y):
+            # Grobfilter: gecachte AABB gegen das Rechteck
+            obj_min_x, obj_min_y, obj_max_x, obj_max_y = bboxes[obj_id]
+            if obj_max_x < min_x or obj_min_x > max_x or obj_max_y < min_y or obj_min_y > max_y:
+                continue
+            # Achsenparallele Rechtecke sind mit der AABB exakt erfasst,
+            # sonst präzise Polygon-Rechteck-Kollisionserkennung
+            if obj_id in axis_aligned or self.polygon_intersects_rectangle(self.points[obj_id], rect_bounds):
+                nearby_objects.append(self.get_object(obj_id))
 
         return nearby_objects
 
@@ -385,27 +768,29 @@ class SpatialHashGrid:
             Liste der kollidierenden Objekte
         """
         # Grid-Bereich basierend auf AABB des Query-Polygons
-        grid_min_x, grid_min_y, grid_max_x, grid_max_y = self.get_grid_bounds(query_polygon)
+        query_bbox = self.calculate_bbox(query_polygon)
+        grid_min_x, grid_min_y = self.world_to_grid(query_bbox[0], query_bbox[1])
+        grid_max_x, grid_max_y = self.world_to_grid(query_bbox[2], query_bbox[3])
 
         colliding_objects = []
-        processed_ids: Set[int] = set()
-
-        for grid_x in range(grid_min_x, grid_max_x + 1):
-            for grid_y in range(grid_min_y, grid_max_y + 1):
-                cell_key = (grid_x, grid_y)
-
-                if cell_key in self.grid:
-                    for obj in self.grid[cell_key]:
-                        if obj['id'] not in processed_ids:
-                            # Präzise Polygon-Polygon-Kollisionserkennung
-                            if self.polygons_intersect(query_polygon, obj['points']):
-                                colliding_objects.append(obj)
-                                processed_ids.add(obj['id'])
+        bboxes = self.bboxes
+        # Sind beide Seiten achsenparallele Rechtecke, genügt der AABB-Vergleich
+        axis_aligned = self.axis_aligned if _is_axis_aligned_rectangle(query_polygon) else ()
+
+        # Nur Zellen, die das Query-Polygon tatsächlich überdeckt, nicht die ganze AABB
+        for obj_id in self._candidate_ids(grid_min_x, grid_min_y, grid_max_x, grid_max_y, query_polygon):
+            # Grobfilter: gecachte AABB gegen die AABB des Query-Polygons
+            if not self.bbox_overlap(query_bbox, bboxes[obj_id]):
+                continue
+            # Präzise Polygon-Polygon-Kollisionserkennung mit den gecachten Kanten des Objekts
+            if obj_id in axis_aligned or _polygons_intersect(query_polygon, self.points[obj_id], self.edges[obj_id]):
+                colliding_objects.append(self.get_object(obj_id))
 
         return colliding_objects
 
     def polygon_overlap(self, poly1: List[Tuple[float, float]],
-                        poly2: List[Tuple[float, float]]) -> bool:
+                        poly2: List[Tuple[float, float]],
+                        edges2: Optional[List[Tuple[float, float, float, float]]] = None) -> bool:
         """
         Effiziente Polygon-Überlappungsprüfung für bereits gefilterte Kandidaten.
         Diese Methode sollte nach AABB-Filterung verwendet werden.
@@ -413,11 +798,12 @@ class SpatialHashGrid:
         Args:
             poly1: Erstes Polygon
             poly2: Zweites Polygon
+            edges2: Gecachte Kanten von poly2, falls es ein Grid-Objekt ist (self.edges[id])
 
         Returns:
             True wenn sich die Polygone überschneiden
         """
-        return self.polygons_intersect(poly1, poly2)
+        return _polygons_intersect(poly1, poly2, edges2)
 
     def point_overlap(self, point: Tuple[float, float],
                       polygon: List[Tuple[float, float]]) -> bool:
@@ -457,9 +843,10 @@ class SpatialHashGrid:
         closest_x = max(min_x, min(center_x, max_x))
         closest_y = max(min_y, min(center_y, max_y))
 
-        # Distanz zum nächsten Punkt
-        distance = math.sqrt((closest_x - center_x) ** 2 + (closest_y - center_y) ** 2)
-        return distance <= radius
+        # Quadrierte Distanz zum nächsten Punkt, spart die Wurzel
+        dx = closest_x - center_x
+        dy = closest_y - center_y
+        return dx * dx + dy * dy <= radius * radius
 
     def bbox_overlap(self, bbox1: Tuple[float, float, float, float],
                      bbox2: Tuple[float, float, float, float]) -> bool:
@@ -472,11 +859,12 @@ class SpatialHashGrid:
 
     def get_statistics(self) -> Dict:
         """Gibt Statistiken über das Grid zurück."""
-        total_cells = len(self.grid)
+        total_cells = len(self.static_grid.keys() | self.dynamic_grid.keys())
         total_objects = len(self.static_objects) + len(self.dynamic_objects)
 
         if total_cells > 0:
-            avg_objects_per_cell = sum(len(cell) for cell in self.grid.values()) / total_cells
+            avg_objects_per_cell = sum(len(cell) for cell in chain(self.static_grid.values(),
+                                                                   self.dynamic_grid.values())) / total_cells
         else:
             avg_objects_per_cell = 0
 
@@ -489,17 +877,53 @@ class SpatialHashGrid:
             'cell_size': self.cell_size
         }
 
+    def auto_tune_cell_size(self) -> float:
+        """
+        Setzt die Zellgröße auf die Wurzel der medianen AABB-Fläche aller Objekte und baut das Grid neu auf.
+        Gedacht für den Aufruf nach einem großen Bulk-Import; ohne (flächige) Objekte bleibt alles unverändert.
+
+        Returns:
+            Die aktuelle Zellgröße
+        """
+        areas = [(max_x - min_x) * (max_y - min_y) for min_x, min_y, max_x, max_y in self.bboxes.values()]
+        if areas:
+            cell_size = math.sqrt(statistics.median(areas))
+            if cell_size > 0 and cell_size != self.cell_size:
+                self.cell_size = cell_size
+                self._rebuild_grid()
+        return self.cell_size
+
+    def _rebuild_grid(self):
+        """Trägt alle Objekte mit der aktuellen Zellgröße neu in die Grids ein (Geometrie und Metadaten bleiben)."""
+        static_objects = list(self.static_objects.items())
+        dynamic_objects = list(self.dynamic_objects.items())
+        self.static_grid.clear()
+        self.dynamic_grid.clear()
+        self.cell_ranges.clear()
+        for objects, is_static in ((static_objects, True), (dynamic_objects, False)):
+            if objects:
+                object_ids, points_list = zip(*objects)
+                self.insert_objects_bulk(object_ids, points_list, is_static=is_static)
+
     def clear(self):
         """Leert das komplette Grid."""
-        self.grid.clear()
+        self.static_grid.clear()
+        self.dynamic_grid.clear()
+        self.points.clear()
+        self.bboxes.clear()
+        self.edges.clear()
+        self.cell_ranges.clear()
+        self.axis_aligned.clear()
+        self.metadata.clear()
         self.static_objects.clear()
         self.dynamic_objects.clear()
 
     def clear_dynamic_objects(self):
         """Leert nur die dynamischen Objekte im Grid."""
-        # Alle dynamischen Objekte entfernen
-        for object_id in list(self.dynamic_objects.keys()):
-            self.remove_object(object_id)
+        # Das dynamische Grid wird als Ganzes geleert, die statischen Zellen bleiben unberührt
+        for object_id in self.dynamic_objects:
+            self._forget(object_id)
+        self.dynamic_grid.clear()
         self.dynamic_objects.clear()
 
     def plot_grid(self):
@@ -551,7 +551,8 @@ class _InSim(_Binding):
             callbacks = self._callbacks.get(EVT_OUTGAUGE)
             if callbacks:
                 packet = insim_.OutGaugePack().unpack(data)
-                [c(self, packet) for c in callbacks]
+                for c in callbacks:
+                    c(self, packet)
         else:
             self._handle_insim_packet(data)
 
@@ -608,7 +609,8 @@ class _OutSim(_Binding):
             callbacks = self._callbacks.get(EVT_OUTGAUGE)
             if callbacks:
                 packet = insim_.OutGaugePack().unpack(data)
-                [c(self, packet) for c in callbacks]
+                for c in callbacks:
+                    c(self, packet)
 
     def _handle_close(self):
         self.close()
@@ -2242,7 +2242,11 @@ DLF_ENGINE_SEVERE = 0x10000000
 
 
 class OutGaugePack(object):
+    __slots__ = ('Time', 'Car', 'Flags', 'Gear', 'PLID', 'Speed', 'RPM', 'Turbo', 'EngTemp', 'Fuel',
+                 'OilPress', 'OilTemp', 'DashLights', 'ShowLights', 'Throttle', 'Brake', 'Clutch',
+                 'Display1', 'Display2', 'ID')
     pack_s = struct.Struct('I3sxH2B7f2I3f15sx15sx')
+    id_s = struct.Struct('i')
 
     def __init__(self):
         self.Time = 0
@@ -2267,12 +2271,12 @@ class OutGaugePack(object):
         self.ID = 0
 
     def unpack(self, data):
-        self.Time, self.Car, self.Flags, self.Gear, self.PLID, self.Speed, self.RPM, self.Turbo, self.EngTemp, self.Fuel, self.OilPress, self.OilTemp, self.DashLights, self.ShowLights, self.Throttle, self.Brake, self.Clutch, self.Display1, self.Display2 = self.pack_s.unpack(
-            data[:92])
+        self.Time, self.Car, self.Flags, self.Gear, self.PLID, self.Speed, self.RPM, self.Turbo, self.EngTemp, self.Fuel, self.OilPress, self.OilTemp, self.DashLights, self.ShowLights, self.Throttle, self.Brake, self.Clutch, self.Display1, self.Display2 = self.pack_s.unpack_from(
+            data)
         self.Display1 = _eat_null_chars(self.Display1)
         self.Display2 = _eat_null_chars(self.Display2)
         if len(data) == 96:
-            self.ID = struct.unpack('i', data[92:])
+            self.ID = self.id_s.unpack_from(data, 92)
         return self
 
 
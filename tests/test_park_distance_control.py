@@ -0,0 +1,59 @@
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+from assistance.park_distance_control import layout_object_id, save_rectangles_as_json
+from misc.helpers import iter_json_lines
+
+
+def layout_object(index: int, x: int, y: int, zbyte: int = 0, heading: int = 0):
+    return SimpleNamespace(Index=index, X=x, Y=y, Zbyte=zbyte, Heading=heading)
+
+
+class LayoutObjectIdTest(unittest.TestCase):
+    """Grid-IDs der Layout-Objekte müssen eindeutig sein"""
+
+    def test_digit_concatenation_is_not_ambiguous(self):
+        self.assertNotEqual(layout_object_id(layout_object(1, 23, 5)),
+                            layout_object_id(layout_object(12, 3, 5)))
+
+    def test_sign_is_kept(self):
+        self.assertNotEqual(layout_object_id(layout_object(96, 100, 5)),
+                            layout_object_id(layout_object(96, -100, 5)))
+        self.assertNotEqual(layout_object_id(layout_object(96, 5, 100)),
+                            layout_object_id(layout_object(96, 5, -100)))
+
+    def test_ids_do_not_overlap_player_ids(self):
+        self.assertGreater(layout_object_id(layout_object(0, 0, 0)), 255)
+
+
+class LegacyRectangleFileTest(unittest.TestCase):
+    """Migration der alten JSON-Array-Datei nach JSON Lines"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmp.name, 'rects.jsonl')
+        self.legacy_filename = os.path.join(self.tmp.name, 'rects.json')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_legacy_file_is_migrated(self):
+        with open(self.legacy_filename, 'w') as f:
+            f.write('[[[0, 0], [1, 0], [1, 1], [0, 1]]]')
+        save_rectangles_as_json([[[2, 2], [3, 2], [3, 3], [2, 3]]], self.filename)
+        self.assertEqual(len(list(iter_json_lines(self.filename))), 2)
+
+    def test_corrupt_legacy_file_is_skipped(self):
+        with open(self.legacy_filename, 'w') as f:
+            f.write('[[[0, 0], [1, 0], [1')
+        save_rectangles_as_json([[[2, 2], [3, 2], [3, 3], [2, 3]]], self.filename)
+        save_rectangles_as_json([[[4, 4], [5, 4], [5, 5], [4, 5]]], self.filename)
+        self.assertEqual(len(list(iter_json_lines(self.filename))), 2)
+        self.assertFalse(os.path.exists(self.legacy_filename))
+        self.assertTrue(os.path.exists(self.legacy_filename + '.corrupt'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+
+from misc.spacial_hash_grid import SpatialHashGrid
+
+
+def square(x: float, y: float, size: float = 1.0) -> list:
+    return [(x, y), (x + size, y), (x + size, y + size), (x, y + size)]
+
+
+class DuplicateIdTest(unittest.TestCase):
+    """Mehrfach eingefügte IDs dürfen keine veralteten Einträge in den Zellen hinterlassen"""
+
+    def setUp(self):
+        self.grid = SpatialHashGrid(cell_size=10.0)
+
+    def test_insert_twice_then_remove(self):
+        self.grid.insert_object(7, square(1, 1))
+        self.grid.insert_object(7, square(1, 1))
+        self.grid.remove_object(7)
+        self.assertEqual(self.grid.query_area_ids(1.5, 1.5, 5.0), [])
+
+    def test_bulk_insert_twice_then_remove(self):
+        self.grid.insert_objects_bulk([7, 8], [square(1, 1), square(3, 3)])
+        self.grid.insert_objects_bulk([7, 7], [square(1, 1), square(2, 2)])
+        self.grid.remove_object(7)
+        self.assertEqual(self.grid.query_area_ids(1.5, 1.5, 5.0), [8])
+
+    def test_reinsert_replaces_geometry(self):
+        self.grid.insert_object(9, square(1, 1))
+        self.grid.insert_object(9, square(55, 55))
+        self.assertEqual(self.grid.query_area_ids(1.5, 1.5, 2.0), [])
+        self.assertEqual(self.grid.query_area_ids(55.5, 55.5, 2.0), [9])
+        self.grid.remove_object(9)
+        self.assertEqual(self.grid.query_area_ids(55.5, 55.5, 2.0), [])
+        self.assertFalse(self.grid.static_grid)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -60,26 +60,27 @@ class MenuSystem:
         """Öffnet das Hauptmenü"""
         self.current_menu = 'main'
         self._clear_menu_buttons()
+        t = self.translator.bind(self.set_language)
 
         buttons = [
-            (21, 0, 80, 20, 5, self.translator.get("Main Menu", self.set_language),
+            (21, 0, 80, 20, 5, t("Main Menu"),
              pyinsim.ISB_LIGHT),
-            (22, 0, 85, 20, 5, self.translator.get("Driving", self.set_language),
+            (22, 0, 85, 20, 5, t("Driving"),
              pyinsim.ISB_DARK | pyinsim.ISB_CLICK),
-            (23, 0, 90, 20, 5, self.translator.get("Parking", self.set_language),
+            (23, 0, 90, 20, 5, t("Parking"),
              pyinsim.ISB_DARK | pyinsim.ISB_CLICK),
-            (24, 0, 95, 20, 5, self.translator.get("System", self.set_language),
+            (24, 0, 95, 20, 5, t("System"),
              pyinsim.ISB_DARK | pyinsim.ISB_CLICK),
-            (25, 0, 100, 20, 5, self.translator.get("Cop Mode", self.set_language),
+            (25, 0, 100, 20, 5, t("Cop Mode"),
              pyinsim.ISB_DARK | pyinsim.ISB_CLICK),
-            (26, 0, 105, 20, 5, self.translator.get("Keys and Axes", self.set_language),
+            (26, 0, 105, 20, 5, t("Keys and Axes"),
              pyinsim.ISB_DARK | pyinsim.ISB_CLICK),
-            (28, 0, 110, 20, 5, self.translator.get("AI Traffic", self.set_language),
+            (28, 0, 110, 20, 5, t("AI Traffic"),
              pyinsim.ISB_DARK | pyinsim.ISB_CLICK),
             (27, 0, 115, 20, 5,
-             self.translator.get("Language", self.set_language) + f": {self.set_language}",
+             t("Language") + f": {self.set_language}",
              pyinsim.ISB_DARK | pyinsim.ISB_CLICK),
-            (40, 0, 120, 20, 5, "^1" + self.translator.get("Close", self.set_language),
+            (40, 0, 120, 20, 5, "^1" + t("Close"),
              pyinsim.ISB_DARK | pyinsim.ISB_CLICK),
         ]
 
@@ -92,6 +93,7 @@ class MenuSystem:
         """Öffnet das Fahrer-Menü"""
         self.current_menu = 'driving'
         self._clear_menu_buttons()
+        t = self.translator.bind(self.set_language)
 
         fcw = "^2" if self.settings.get('forward_collision_warning') else "^1"
         bsw = "^2" if self.settings.get('blind_spot_warning') else "^1"
@@ -102,35 +104,35 @@ class MenuSystem:
         hba = "^2" if self.settings.get('high_beam_assist') else "^1"
 
         distance = self.settings.get('collision_warning_distance')
-        distance_text = "^2" + self.translator.get("Early", self.set_language) if distance == 0 else "^3" + self.translator.get("Medium", self.set_language) if distance == 1 else "^1" + self.translator.get("Late", self.set_language)
+        distance_text = "^2" + t("Early") if distance == 0 else "^3" + t("Medium") if distance == 1 else "^1" + t("Late")
 
         ctw_distance = self.settings.get('cross_traffic_warning_distance')
-        ctw_distance_text = "^2" + self.translator.get("Early", self.set_language) if ctw_distance == 0 else "^3" + self.translator.get("Medium", self.set_language) if ctw_distance == 1 else "^1" + self.translator.get("Late", self.set_language)
+        ctw_distance_text = "^2" + t("Early") if ctw_distance == 0 else "^3" + t("Medium") if ctw_distance == 1 else "^1" + t("Late")
 
         buttons = [
-            (21, 0, 70, 25, 5, self.translator.get("Driving Settings", self.set_language),
+            (21, 0, 70, 25, 5, t("Driving Settings"),
              pyinsim.ISB_LIGHT),
-            (22, 0, 75, 25, 5, fcw + self.translator.get("Collision Warning", self.set_language),
+            (22, 0, 75, 25, 5, fcw + t("Collision Warning"),
              pyinsim.ISB_DARK | pyinsim.ISB_CLICK),
             (23, 25, 75, 15, 5, distance_text,
              pyinsim.ISB_DARK | pyinsim.ISB_CLICK),
-            (24, 0, 80, 25, 5, bsw + self.translator.get("Blind Spot Warn.", self.set_language),
+            (24, 0, 80, 25, 5, bsw + t("Blind Spot Warn."),
              pyinsim.ISB_DARK | pyinsim.ISB_CLICK),
-            (25, 0, 85, 25, 5, ctw + self.translator.get("Cross Traffic Warn.", self.set_language),
+            (25, 0, 85, 25, 5, ctw + t("Cross Traffic Warn."),
              pyinsim.ISB_DARK | pyinsim.ISB_CLICK),
             (31, 25, 85, 15, 5, ctw_distance_text,
              pyinsim.ISB_DARK | pyinsim.ISB_CLICK),
-            (26, 0, 90, 25, 5, agb + self.translator.get("Automatic Gearbox", self.set_language),
+            (26, 0, 90, 25, 5, agb + t("Automatic Gearbox"),
              pyinsim.ISB_DARK | pyinsim.ISB_CLICK),
-            (30, 25, 90, 15, 5, self.translator.get("Calibrate", self.set_language),
+            (30, 25, 90, 15, 5, t("Calibrate"),
              pyinsim.ISB_DARK | pyinsim.ISB_CLICK),
-            (27, 0, 95, 25, 5, ah + self.translator.get("Auto Hold", self.set_language),
+            (27, 0, 95, 25, 5, ah + t("Auto Hold"),
              pyinsim.ISB_DARK | pyinsim.ISB_CLICK),
-            (28, 0, 100, 25, 5, al + self.translator.get("Adaptive Lights", self.set_language),
+            (28, 0, 100, 25, 5, al + t("Adaptive Lights"),
              pyinsim.ISB_DARK | pyinsim.ISB_CLICK),
-            (29, 0, 105, 25, 5, hba + self.translator.get("High Beam Assist", self.set_language),
+            (29, 0, 105, 25, 5, hba + t("High Beam Assist"),
              pyinsim.ISB_DARK | pyinsim.ISB_CLICK),
-            (40, 0, 110, 25, 5, "^1" + self.translator.get("Close", self.set_language),
+            (40, 0, 110, 25, 5, "^1" + t("Close"),
              pyinsim.ISB_DARK | pyinsim.ISB_CLICK),
         ]
 
@@ -143,24 +145,25 @@ class MenuSystem:
         """Öffnet das Parken-Menü"""
         self.current_menu = 'parking'
         self._clear_menu_buttons()
+        t = self.translator.bind(self.set_language)
 
         pdc_on = self.settings.get('park_distance_control')
         pdc = "^2" if pdc_on else "^1"
         pdc_mode = self.settings.get('park_distance_control_mode')
         pdc_mode_text = (
-            self.translator.get("Visual", self.set_language) if pdc_mode == 1
-            else self.translator.get("Visual & Audio", self.set_language) if pdc_mode == 2
-            else "^1" + self.translator.get("Off", self.set_language)
+            t("Visual") if pdc_mode == 1
+            else t("Visual & Audio") if pdc_mode == 2
+            else "^1" + t("Off")
         )
 
         buttons = [
-            (21, 0, 80, 25, 5, self.translator.get("Parking Settings", self.set_language),
+            (21, 0, 80, 25, 5, t("Parking Settings"),
              pyinsim.ISB_LIGHT),
-            (22, 0, 85, 25, 5, pdc + self.translator.get("Park Distance Control", self.set_language),
+            (22, 0, 85, 25, 5, pdc + t("Park Distance Control"),
              pyinsim.ISB_DARK | pyinsim.ISB_CLICK),
             (23, 25, 85, 20, 5, pdc_mode_text,
              (pyinsim.ISB_DARK | pyinsim.ISB_CLICK) if pdc_on else pyinsim.ISB_LIGHT),
-            (40, 0, 90, 25, 5, "^1" + self.translator.get("Close", self.set_language),
+            (40, 0, 90, 25, 5, "^1" + t("Close"),
              pyinsim.ISB_DARK | pyinsim.ISB_CLICK),
         ]
 
@@ -173,34 +176,35 @@ class MenuSystem:
         """Öffnet die Systemeinstellungen"""
         self.current_menu = 'system'
         self._clear_menu_buttons()
+        t = self.translator.bind(self.set_language)
 
         unit = self.settings.get('unit')
-        unit_text = "^2" + self.translator.get("Metric", self.set_language) if unit == "metric" else "^2" + self.translator.get("Imperial", self.set_language)
+        unit_text = "^2" + t("Metric") if unit == "metric" else "^2" + t("Imperial")
         hud_on = self.settings.get('hud_active')
         hud_text = "^2" if hud_on else "^1"
         hud_h = self.settings.get('hud_height')
         hud_w = self.settings.get('hud_width')
 
         buttons = [
-            (21, 0, 75, 25, 5, self.translator.get("System Settings", self.set_language),
+            (21, 0, 75, 25, 5, t("System Settings"),
              pyinsim.ISB_LIGHT),
-            (22, 0, 80, 20, 5, self.translator.get("Unit", self.set_language),
+            (22, 0, 80, 20, 5, t("Unit"),
              pyinsim.ISB_DARK | pyinsim.ISB_CLICK),
             (23, 20, 80, 10, 5, unit_text,
              pyinsim.ISB_LIGHT),
-            (24, 0, 85, 20, 5, hud_text + self.translator.get("Head-Up Display", self.set_language),
+            (24, 0, 85, 20, 5, hud_text + t("Head-Up Display"),
              pyinsim.ISB_DARK | pyinsim.ISB_CLICK),
-            (25, 0, 90, 25, 5, f"^7{self.translator.get('HUD Position', self.set_language)}  (V:{hud_h}  H:{hud_w})",
+            (25, 0, 90, 25, 5, f"^7{t('HUD Position')}  (V:{hud_h}  H:{hud_w})",
              pyinsim.ISB_LIGHT),
-            (26, 25, 90, 5, 5, "^7" + self.translator.get("Up", self.set_language),
+            (26, 25, 90, 5, 5, "^7" + t("Up"),
              pyinsim.ISB_DARK | pyinsim.ISB_CLICK),
-            (27, 30, 90, 5, 5, "^7" + self.translator.get("Down", self.set_language),
+            (27, 30, 90, 5, 5, "^7" + t("Down"),
              pyinsim.ISB_DARK | pyinsim.ISB_CLICK),
-            (28, 35, 90, 5, 5, "^7" + self.translator.get("Left", self.set_language),
+            (28, 35, 90, 5, 5, "^7" + t("Left"),
              pyinsim.ISB_DARK | pyinsim.ISB_CLICK),
-            (29, 40, 90, 5, 5, "^7" + self.translator.get("Right", self.set_language),
+            (29, 40, 90, 5, 5, "^7" + t("Right"),
              pyinsim.ISB_DARK | pyinsim.ISB_CLICK),
-            (40, 0, 95, 25, 5, "^1" + self.translator.get("Close", self.set_language),
+            (40, 0, 95, 25, 5, "^1" + t("Close"),
              pyinsim.ISB_DARK | pyinsim.ISB_CLICK),
         ]
 
@@ -213,15 +217,16 @@ class MenuSystem:
         """Öffnet das Cop-Mode-Menü"""
         self.current_menu = 'cop'
         self._clear_menu_buttons()
+        t = self.translator.bind(self.set_language)
 
         cop = "^2" if self.settings.get('cop_assistance') else "^1"
 
         buttons = [
-            (21, 0, 80, 25, 5, self.translator.get("Cop Mode Settings", self.set_language),
+            (21, 0, 80, 25, 5, t("Cop Mode Settings"),
              pyinsim.ISB_LIGHT),
-            (22, 0, 85, 25, 5, cop + self.translator.get("Cop Assistance", self.set_language),
+            (22, 0, 85, 25, 5, cop + t("Cop Assistance"),
              pyinsim.ISB_DARK | pyinsim.ISB_CLICK),
-            (40, 0, 90, 25, 5, "^1" + self.translator.get("Close", self.set_language),
+            (40, 0, 90, 25, 5, "^1" + t("Close"),
              pyinsim.ISB_DARK | pyinsim.ISB_CLICK),
         ]
 
@@ -234,20 +239,21 @@ class MenuSystem:
         """Öffnet das AI-Traffic-Menü"""
         self.current_menu = 'ai_traffic'
         self._clear_menu_buttons()
+        t = self.translator.bind(self.set_language)
 
         if self.ai_traffic_active:
             toggle_color = "^2"
-            toggle_text = self.translator.get("Stop AI Traffic", self.set_language)
+            toggle_text = t("Stop AI Traffic")
         else:
             toggle_color = "^1"
-            toggle_text = self.translator.get("Start AI Traffic", self.set_language)
+            toggle_text = t("Start AI Traffic")
 
         buttons = [
-            (21, 0, 80, 25, 5, self.translator.get("AI Traffic", self.set_language),
+            (21, 0, 80, 25, 5, t("AI Traffic"),
              pyinsim.ISB_LIGHT),
             (22, 0, 85, 25, 5, toggle_color + toggle_text,
              pyinsim.ISB_DARK | pyinsim.ISB_CLICK),
-            (40, 0, 90, 25, 5, "^1" + self.translator.get("Close", self.set_language),
+            (40, 0, 90, 25, 5, "^1" + t("Close"),
              pyinsim.ISB_DARK | pyinsim.ISB_CLICK),
         ]
 
@@ -260,6 +266,7 @@ class MenuSystem:
         """Öffnet die Einstellungen für Tastenbelegung und Achsen"""
         self.current_menu = 'keys'
         self._clear_menu_buttons()
+        t = self.translator.bind(self.set_language)
 
         handbrake_key = self.settings.get('user_handbrake_key').upper()
         shift_up_key = self.settings.get('user_shift_up_key').upper()
@@ -268,24 +275,24 @@ class MenuSystem:
         ignition_key = self.settings.get('user_ignition_key').upper()
 
         buttons = [
-            (21, 0, 75, 25, 5, self.translator.get("Keys and Axes", self.set_language),
+            (21, 0, 75, 25, 5, t("Keys and Axes"),
              pyinsim.ISB_LIGHT),
-            (22, 0, 80, 20, 5, self.translator.get("Handbrake Key", self.set_language),
+            (22, 0, 80, 20, 5, t("Handbrake Key"),
              pyinsim.ISB_DARK | pyinsim.ISB_CLICK),
-            (23, 0, 85, 20, 5, self.translator.get("Shift Up Key", self.set_language),
+            (23, 0, 85, 20, 5, t("Shift Up Key"),
              pyinsim.ISB_DARK | pyinsim.ISB_CLICK),
-            (24, 0, 90, 20, 5, self.translator.get("Shift Down Key", self.set_language),
+            (24, 0, 90, 20, 5, t("Shift Down Key"),
              pyinsim.ISB_DARK | pyinsim.ISB_CLICK),
-            (25, 0, 95, 20, 5, self.translator.get("Clutch Key", self.set_language),
+            (25, 0, 95, 20, 5, t("Clutch Key"),
              pyinsim.ISB_DARK | pyinsim.ISB_CLICK),
-            (26, 0, 100, 20, 5, self.translator.get("Ignition Key", self.set_language),
+            (26, 0, 100, 20, 5, t("Ignition Key"),
              pyinsim.ISB_DARK | pyinsim.ISB_CLICK),
             (27, 20, 80, 5, 5, f"{handbrake_key}", pyinsim.ISB_LIGHT),
             (28, 20, 85, 5, 5, f"{shift_up_key}", pyinsim.ISB_LIGHT),
             (29, 20, 90, 5, 5, f"{shift_down_key}", pyinsim.ISB_LIGHT),
             (30, 20, 95, 5, 5, f"{clutch_key}", pyinsim.ISB_LIGHT),
             (31, 20, 100, 5, 5, f"{ignition_key}", pyinsim.ISB_LIGHT),
-            (40, 0, 105, 25, 5, "^1" + self.translator.get("Close", self.set_language),
+            (40, 0, 105, 25, 5, "^1" + t("Close"),
              pyinsim.ISB_DARK | pyinsim.ISB_CLICK),
         ]
 
@@ -298,17 +305,18 @@ class MenuSystem:
         """Show user prompt to press a key for binding"""
         self.current_menu = 'await_key'
         self._clear_menu_buttons()
+        t = self.translator.bind(self.set_language)
 
-        text = f"^7{self.translator.get('Key', self.set_language)} {setting}, {self.translator.get('currently bound to', self.set_language)} '{self.settings.get(setting)}'."
+        text = f"^7{t('Key')} {setting}, {t('currently bound to')} '{self.settings.get(setting)}'."
 
         buttons = [
-            (21, 0, 80, 25, 5, self.translator.get("Rebind Key", self.set_language),
+            (21, 0, 80, 25, 5, t("Rebind Key"),
              pyinsim.ISB_LIGHT),
-            (22, 0, 85, 25, 5, self.translator.get("Press a key to bind...", self.set_language),
+            (22, 0, 85, 25, 5, t("Press a key to bind..."),
              pyinsim.ISB_LIGHT),
             (23, 0, 90, 50, 5, text,
              pyinsim.ISB_LIGHT),
-            (40, 0, 95, 25, 5, "^1" + self.translator.get("Cancel", self.set_language),
+            (40, 0, 95, 25, 5, "^1" + t("Cancel"),
              pyinsim.ISB_DARK | pyinsim.ISB_CLICK),
         ]
 
@@ -5,6 +5,7 @@ from typing import Dict, List
 import pyinsim
 from core.event_bus import EventBus
 from core.settings_manager import SettingsManager
+from lfs.connector import encode_command
 from lfs.message_sender import MessageSender
 from misc.pdc_beep import PDCBeepController
 
@@ -109,7 +110,7 @@ class UIManager:
                                           f"Distance: {decel:.2f} m", pyinsim.ISB_DARK)
     def _handle_lfs_command(self, data):
         command = data['command']
-        self.message_sender.send_command(command)
+        self.message_sender.send_command(encode_command(command))
 
     def _update_notifications(self, data):
         self.notifications.append(data['notification'])
@@ -145,7 +146,7 @@ class UIManager:
             self.message_sender.create_button(60 , top_left[0] , top_left[1] +6,
                                               3, 2, "^7PDC", pyinsim.ISB_DARK)
             # create buttons for each PDC sensor
-            for i, distance in enumerate(self.pdc_data.values()):
+            for i, distance in enumerate(self.pdc_data):
                 if i < 3:  # Front sensors (0, 1, 2)
                     # Green button (furthest distance)
                     if distance >= 1:
@@ -1,6 +1,10 @@
+import math
+
 import pyinsim
 from vehicles.vehicle import Vehicle
 
+PDC_SENSOR_ANGLE = 25  # Öffnungswinkel der PDC-Sensoren zur Fahrzeugachse in Grad
+
 
 class OwnVehicle(Vehicle):
     """Repräsentiert das eigene Fahrzeug mit erweiterten Daten"""
@@ -32,7 +36,31 @@ class OwnVehicle(Vehicle):
         self.oil_light: bool = False
         self.eng_light: bool = False
 
+        # sin/cos-Cache der Ausrichtung: (cos, sin) für Fahrzeugachse, Senkrechte und beide PDC-Sensorwinkel
+        self.trig_cache = (1.0, 0.0, 0.0, 1.0, 1.0, 0.0, 1.0, 0.0)
+        self._trig_heading = None
+        self.update_trig_cache()
+
+    def update_position(self, x: float, y: float, z: float, heading: float,
+                        direction: float, speed: float):
+        """Aktualisiert Position und Bewegungsdaten"""
+        super().update_position(x, y, z, heading, direction, speed)
+        self.update_trig_cache()
 
+    def update_trig_cache(self):
+        """Berechnet sin/cos der Ausrichtung neu, falls sich das Heading geändert hat"""
+        if self.data.heading == self._trig_heading:
+            return
+        self._trig_heading = self.data.heading
+        angle_of_car = (self.data.heading + 16384) / 182.05
+        angles = (angle_of_car, angle_of_car + 90,
+                  angle_of_car + PDC_SENSOR_ANGLE, angle_of_car - PDC_SENSOR_ANGLE)
+        cache = []
+        for angle in angles:
+            rad = math.radians(angle)
+            cache.append(math.cos(rad))
+            cache.append(math.sin(rad))
+        self.trig_cache = tuple(cache)
 
     def update_outgauge_data(self, packet):
         """Aktualisiert Daten aus OutGauge-Paket"""
@@ -1,6 +1,7 @@
 import time
 from typing import Dict, List, Any, Optional
 
+import pyinsim
 from core.event_bus import EventBus
 from vehicles.own_vehicle import OwnVehicle
 from vehicles.vehicle import Vehicle
@@ -98,10 +99,10 @@ class VehicleManager:
 
         self.time_since_last_update = time.perf_counter()
 
-    def _get_control_mode(self, flags):
-        if len(flags) >= 11 and flags[-11] == 1:
+    def _get_control_mode(self, flags: int):
+        if flags & pyinsim.PIF_MOUSE:
             return 0  # mouse
-        elif (len(flags) >= 12 and flags[-12] == 1) or (len(flags) >= 13 and flags[-13] == 1):
+        elif flags & (pyinsim.PIF_KB_NO_HELP | pyinsim.PIF_KB_STABILISED):
             return 1  # keyboard
         else:
             return 2  # wheel
@@ -111,7 +112,7 @@ class VehicleManager:
         player_info = {
             "PName": npl_packet.PName,
             "CName": npl_packet.CName,
-            "ControlMode": self._get_control_mode([int(i) for i in bin(npl_packet.Flags)[2:]])
+            "ControlMode": self._get_control_mode(npl_packet.Flags)
         }
         self.players[npl_packet.PLID] = player_info
         self.event_bus.emit('player_data_updated', self.players)